@@ -0,0 +1,188 @@
+"""
+Benchmark parse, part1 and part2 of each day and compare against a baseline
+
+    python -m aoc.bench run -o baseline.json          # benchmark all days
+    python -m aoc.bench run 9 14 -o current.json      # benchmark selected days
+    python -m aoc.bench compare baseline.json current.json --threshold 0.1
+"""
+import argparse
+import json
+import math
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from aoc.inputs import load_input
+from aoc.runner import available_days, call_part, load_day, parse_function, parts
+
+
+@dataclass
+class Timing:
+    warmup: float  # the first call, which includes numba compilation (e.g. day17)
+    best: float
+    median: float
+    repeat: int
+
+
+def measure(
+    func: Callable[[Any], Any],
+    setup: Callable[[], Any] = lambda: None,
+    min_time: float = 0.5,
+    max_repeat: int = 1000,
+) -> Timing:
+    """
+    Time func(setup()) repeatedly, excluding the time spent in setup
+
+    The first call is only a warm-up and not part of the statistics, the number of
+    repetitions is calibrated so that all repetitions take roughly min_time seconds.
+    """
+
+    def _timed() -> float:
+        arg = setup()
+        start = time.perf_counter()
+        func(arg)
+        return time.perf_counter() - start
+
+    warmup = _timed()
+    samples = [_timed()]
+    repeat = min(max_repeat, max(1, math.ceil(min_time / max(samples[0], 1e-9))))
+    samples += [_timed() for _ in range(repeat - 1)]
+    return Timing(warmup, min(samples), statistics.median(samples), repeat)
+
+
+def bench_day(day: int, input_name: str | None = None, **kwargs) -> dict[str, Timing]:
+    module = load_day(day)
+    data = load_input(day, input_name)
+    parse = parse_function(module)
+
+    timings = {"parse": measure(lambda _: parse(data), **kwargs)}
+    parsed = parse(data)
+    for part in parts(module):
+        timings[part] = measure(
+            lambda _, part=part: call_part(module, day, part, parsed), **kwargs
+        )
+    return timings
+
+
+@dataclass
+class Regression:
+    day: str
+    phase: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+    def __str__(self) -> str:
+        return (
+            f"day {self.day:>2} {self.phase:<6} {self.baseline:10.6f}s -> "
+            f"{self.current:10.6f}s ({self.ratio - 1:+.1%})"
+        )
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.1) -> list[Regression]:
+    """
+    Compare the best timings of two benchmark results, returning every phase that
+    got slower by more than the given threshold. Phases missing in either are skipped
+    """
+    regressions = []
+    for day, phases in current.items():
+        for phase, timing in phases.items():
+            reference = baseline.get(day, {}).get(phase)
+            if reference is None:
+                continue
+            if timing["best"] > reference["best"] * (1 + threshold):
+                regressions.append(
+                    Regression(day, phase, reference["best"], timing["best"])
+                )
+    return regressions
+
+
+def _run(args: argparse.Namespace):
+    results = {}
+    for day in args.days or available_days():
+        timings = bench_day(day, args.input, min_time=args.min_time)
+        results[str(day)] = {phase: asdict(t) for phase, t in timings.items()}
+        for phase, timing in timings.items():
+            print(
+                f"day {day:2} {phase:<6} best {timing.best:10.6f}s "
+                f"median {timing.median:10.6f}s  warm-up {timing.warmup:10.6f}s "
+                f"({timing.repeat}x)",
+                flush=True,
+            )
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output)
+    else:
+        print(output)
+
+
+def _compare(args: argparse.Namespace) -> int:
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    regressions = compare(baseline, current, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print(f"no phase regressed by more than {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.bench",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="benchmark the given days")
+    run.add_argument("days", nargs="*", type=int, help="days to run (default all)")
+    run.add_argument("-i", "--input", help="name of the inputs to use")
+    run.add_argument("-o", "--output", type=Path, help="write results to this file")
+    run.add_argument(
+        "--min-time", type=float, default=0.5, help="seconds to spend per phase"
+    )
+
+    diff = commands.add_parser("compare", help="compare a run against a baseline")
+    diff.add_argument("baseline", type=Path)
+    diff.add_argument("current", type=Path)
+    diff.add_argument(
+        "--threshold", type=float, default=0.1, help="allowed relative slowdown"
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "compare":
+        return _compare(args)
+    _run(args)
+    return 0
+
+
+def test_measure():
+    calls = []
+    timing = measure(calls.append, setup=lambda: 1, min_time=0, max_repeat=10)
+    assert timing.repeat == 1
+    assert calls == [1, 1]  # warm-up and a single timed call
+    assert timing.best <= timing.median
+
+
+def test_compare():
+    baseline = {"1": {"parse": {"best": 1.0}, "part1": {"best": 1.0}}}
+    current = {
+        "1": {"parse": {"best": 1.05}, "part1": {"best": 1.5}},
+        "2": {"parse": {"best": 9.0}},  # not part of the baseline
+    }
+    (regression,) = compare(baseline, current, threshold=0.1)
+    assert (regression.day, regression.phase) == ("1", "part1")
+    assert regression.ratio == 1.5
+    assert compare(baseline, current, threshold=0.6) == []
+
+
+if __name__ == "__main__":
+    sys.exit(main())
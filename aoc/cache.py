@@ -0,0 +1,143 @@
+"""
+On-disk cache of puzzle answers
+
+Answers are stored as small files below ``.aoc_cache/``, keyed on the day, the part,
+the sha256 of the input and a hash of the solution's source code, so changing either
+the input or the solution invalidates them. Only the MAX_ENTRIES most recently used
+answers are kept.
+
+``python -m aoc`` uses the cache unless ``--no-cache`` is given or the ``AOC_NO_CACHE``
+environment variable is set. Benchmarks never use it.
+"""
+import hashlib
+import os
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+
+CACHE_DIR = Path(__file__).parent.parent / ".aoc_cache"
+MAX_ENTRIES = 256
+
+
+def enabled() -> bool:
+    return not os.environ.get("AOC_NO_CACHE")
+
+
+def code_hash(module: ModuleType) -> str:
+    """sha256 of the source of a module and of all aoc modules it uses directly"""
+    names = {module.__name__}
+    for value in vars(module).values():
+        name = value.__name__ if isinstance(value, ModuleType) else None
+        name = name or getattr(value, "__module__", None)
+        if isinstance(name, str) and name.startswith("aoc."):
+            names.add(name)
+
+    digest = hashlib.sha256()
+    for name in sorted(names):
+        digest.update(Path(sys.modules[name].__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def cache_key(day: int, part: str, input_digest: str, code_digest: str) -> str:
+    return hashlib.sha256(
+        f"{day}:{part}:{input_digest}:{code_digest}".encode()
+    ).hexdigest()
+
+
+def _path(key: str) -> Path:
+    return CACHE_DIR / f"{key}.txt"
+
+
+# worker processes share the cache, so any answer may be evicted by another one at
+# any time, e.g. right after it was read or written
+
+
+def _touch(path: Path):
+    now = time.time_ns()
+    try:
+        os.utime(path, ns=(now, now))
+    except FileNotFoundError:
+        pass
+
+
+def _last_use(path: Path) -> int:
+    """Modification time of an answer, or -1 if it has been evicted already"""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return -1
+
+
+def get(key: str) -> str | None:
+    """The cached answer, or None if there is none"""
+    path = _path(key)
+    try:
+        answer = path.read_text()
+    except FileNotFoundError:
+        return None
+    _touch(path)  # the modification time is the time of the last use
+    return answer
+
+
+def put(key: str, answer: str, max_entries: int = MAX_ENTRIES):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = _path(key)
+    path.write_text(answer)
+    _touch(path)
+    evict(max_entries)
+
+
+def evict(max_entries: int = MAX_ENTRIES):
+    """Remove the least recently used answers until at most max_entries are left"""
+    entries = sorted(CACHE_DIR.glob("*.txt"), key=_last_use)
+    for path in entries[: max(len(entries) - max_entries, 0)]:
+        path.unlink(missing_ok=True)
+
+
+def clear():
+    for path in CACHE_DIR.glob("*.txt"):
+        path.unlink(missing_ok=True)
+
+
+def test_get_and_put(tmp_path, monkeypatch):
+    monkeypatch.setattr(f"{__name__}.CACHE_DIR", tmp_path)
+    key = cache_key(1, "part1", "input", "code")
+    assert get(key) is None
+    put(key, "24000")
+    assert get(key) == "24000"
+    assert get(cache_key(1, "part1", "other input", "code")) is None
+
+    clear()
+    assert get(key) is None
+
+
+def test_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(f"{__name__}.CACHE_DIR", tmp_path)
+    put("a", "1", max_entries=2)
+    put("b", "2", max_entries=2)
+    assert get("a") == "1"  # a is now used more recently than b
+    put("c", "3", max_entries=2)
+    assert (get("a"), get("b"), get("c")) == ("1", None, "3")
+
+
+def test_evicted_by_another_process(tmp_path, monkeypatch):
+    monkeypatch.setattr(f"{__name__}.CACHE_DIR", tmp_path)
+    put("a", "1")
+    path = _path("a")
+    path.unlink()  # as if evicted by another worker right after it was read
+    _touch(path)
+    assert _last_use(path) == -1
+    assert not path.exists()
+
+    # an answer disappearing while the others are sorted by their last use
+    monkeypatch.setattr(f"{__name__}._last_use", lambda p: p.unlink() or -1)
+    put("b", "2", max_entries=0)
+    assert get("b") is None
+
+
+def test_code_hash():
+    from aoc import day01, day09
+
+    assert code_hash(day01) != code_hash(day09)
+    assert code_hash(day09) == code_hash(day09)
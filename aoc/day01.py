@@ -1,31 +1,211 @@
+import heapq
+import io
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from pathlib import Path
+from typing import Iterable
+
 import numpy as np
 import pytest
-from aocd.models import Puzzle
+
+from aoc.inputs import load_input
+
+CHUNK_SIZE = 64 * 1024 * 1024  # bytes per chunk parsed by one worker
+
+
+def parse(data: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parse the calories of all elves into one flat array, in a single pass, plus the
+    index at which the calories of each elf start
+
+    1000
+    2000
+
+    3000
+
+    > [1000, 2000, 3000], [0, 2]
+    """
+    # calories are positive, mark the blank lines between two elves with -1
+    values = np.fromstring(
+        data.strip().replace("\n\n", "\n-1\n"), dtype=np.int64, sep="\n"
+    )
+    separators = np.flatnonzero(values < 0)
+    calories = np.delete(values, separators)
+    # every separator before an elf shifts its start by one in the flat array
+    starts = np.concatenate([[0], separators - np.arange(len(separators))])
+    return calories, starts
+
+
+def _totals(calories: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Calories carried by each elf"""
+    return np.add.reduceat(calories, starts)
+
+
+def top_k(totals: np.ndarray, k: int) -> np.ndarray:
+    """The k largest totals, largest first, without sorting all of them"""
+    if k <= 0:
+        return totals[:0]
+    if k < len(totals):
+        totals = np.partition(totals, -k)[-k:]
+    return np.sort(totals)[::-1]
 
 
-def parse(data: str) -> list[np.ndarray]:
-    elves = data.split("\n\n")
-    return [np.fromstring(elf, dtype=int, sep="\n") for elf in elves]
+def stream_top_k(lines: Iterable[str], k: int = 3) -> list[int]:
+    """
+    The k largest elf totals, largest first, from the lines of an input (e.g. an open
+    file). Only the total of the current elf and a heap of the k largest totals so far
+    are kept in memory
+    """
+    heap = []
+    if k <= 0:
+        return heap
+    total = None  # None in between two elves
+    for line in lines:
+        line = line.strip()
+        if line:
+            total = (total or 0) + int(line)
+            continue
+        if total is not None:
+            _push(heap, total, k)
+        total = None
 
+    if total is not None:  # the last elf isn't followed by a blank line
+        _push(heap, total, k)
+    return sorted(heap, reverse=True)
 
-def part1(elf_calories: list[np.ndarray]) -> int:
-    sums = [calories.sum() for calories in elf_calories]
-    return np.max(sums)
 
+def _push(heap: list[int], value: int, k: int):
+    """Add a value to a min-heap holding the k largest values seen"""
+    if len(heap) < k:
+        heapq.heappush(heap, value)
+    elif value > heap[0]:
+        heapq.heapreplace(heap, value)
 
-def part2(elf_calories: list[np.ndarray]) -> int:
-    sums = np.sort([calories.sum() for calories in elf_calories])
-    return sums[-3:].sum()
+
+def _chunk_ranges(buffer: mmap.mmap, chunk_size: int) -> list[tuple[int, int]]:
+    """Split a buffer into byte ranges of at least chunk_size, ending at blank lines"""
+    ranges = []
+    start = 0
+    while start < len(buffer):
+        end = buffer.find(b"\n\n", start + chunk_size)
+        end = len(buffer) if end < 0 else end + 2
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _chunk_top_k(path: Path, start: int, end: int, k: int) -> list[int]:
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = mm[start:end].decode()
+    if not data.strip():
+        return []
+    return top_k(_totals(*parse(data)), k).tolist()
+
+
+def parallel_top_k(
+    path: Path, k: int = 3, workers: int | None = None, chunk_size: int = CHUNK_SIZE
+) -> list[int]:
+    """
+    The k largest elf totals of an input file, largest first. The file is split into
+    chunks at blank lines, which are parsed in a process pool, and the top k totals
+    of all chunks are merged
+    """
+    path = Path(path)
+    # nothing to find, and mmap can't map empty files
+    if k <= 0 or path.stat().st_size == 0:
+        return []
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        ranges = _chunk_ranges(mm, chunk_size)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_chunk_top_k, path, *r, k) for r in ranges]
+        return heapq.nlargest(k, chain.from_iterable(f.result() for f in futures))
+
+
+def part1(calories: np.ndarray, starts: np.ndarray) -> int:
+    return int(_totals(calories, starts).max())
+
+
+def part2(calories: np.ndarray, starts: np.ndarray) -> int:
+    return int(top_k(_totals(calories, starts), 3).sum())
 
 
 @pytest.fixture()
-def puzzle_input() -> list[np.ndarray]:
-    return parse(Puzzle(2022, 1).input_data)
+def puzzle_input() -> tuple[np.ndarray, np.ndarray]:
+    return parse(load_input(1))
+
+
+EXAMPLE = """
+1000
+2000
+3000
+
+4000
+
+5000
+6000
+
+7000
+8000
+9000
+
+10000
+"""
+
+
+@pytest.fixture()
+def example_input() -> tuple[np.ndarray, np.ndarray]:
+    return parse(EXAMPLE.strip())
+
+
+def test_parse(example_input):
+    calories, starts = example_input
+    assert len(calories) == 10
+    assert starts.tolist() == [0, 3, 4, 6, 9]
 
 
 def test_part1(puzzle_input):
-    assert part1(puzzle_input) == 67633
+    assert part1(*puzzle_input) == 67633
+
+
+def test_example_part1(example_input):
+    assert part1(*example_input) == 24000
 
 
 def test_part2(puzzle_input):
-    assert part2(puzzle_input) == 199628
+    assert part2(*puzzle_input) == 199628
+
+
+def test_example_part2(example_input):
+    assert part2(*example_input) == 45000
+
+
+def test_top_k(example_input):
+    totals = _totals(*example_input)
+    assert top_k(totals, 3).tolist() == [24000, 11000, 10000]
+    assert top_k(totals, 10).tolist() == [24000, 11000, 10000, 6000, 4000]
+    assert top_k(totals, 0).tolist() == top_k(totals, -1).tolist() == []
+
+
+def test_stream_top_k():
+    assert stream_top_k(io.StringIO(EXAMPLE)) == [24000, 11000, 10000]
+    assert stream_top_k(EXAMPLE.strip().splitlines(), k=1) == [24000]
+    assert stream_top_k(io.StringIO(EXAMPLE), k=10) == [24000, 11000, 10000, 6000, 4000]
+    assert stream_top_k([]) == []
+    assert stream_top_k(io.StringIO(EXAMPLE), k=0) == []
+
+
+def test_parallel_top_k(tmp_path):
+    path = tmp_path / "01.txt"
+    path.write_text("\n\n".join([EXAMPLE.strip()] * 20 + ["30000"]))
+
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        ranges = _chunk_ranges(mm, chunk_size=100)
+    assert len(ranges) > 1
+    assert all(mm_end == start for (_, mm_end), (start, _) in zip(ranges, ranges[1:]))
+
+    expected = stream_top_k(path.read_text().splitlines(), k=4)
+    assert parallel_top_k(path, k=4, workers=2, chunk_size=100) == expected
+    assert expected == [30000, 24000, 24000, 24000]
+    assert parallel_top_k(path, k=0) == []
@@ -1,9 +1,51 @@
+import numpy as np
 import pytest
-from aocd.models import Puzzle
 
+from aoc.inputs import load_input
 
-def parse(data: str) -> list[tuple[str, str]]:
-    return [line.split() for line in data.strip().splitlines()]
+
+def parse(data: str) -> np.ndarray:
+    """
+    Encode every round as a single number 3 * opponent + own column, both counted
+    from 0, straight from the input bytes
+
+    A Y
+    B X
+
+    > [1, 3]
+    """
+    chars = np.frombuffer(data.encode(), dtype=np.uint8)
+    columns = _columns(chars)
+    if columns is None:
+        # line endings or stray whitespace: drop all whitespace bytes, then the rounds
+        # are rows of 2 bytes
+        chars = chars[np.flatnonzero(chars > ord(" "))]
+        if len(chars) % 2:
+            raise ValueError("every round needs exactly two columns")
+        columns = chars.reshape(-1, 2)
+
+    # counted from 0, anything before "A" or "X" wraps around to a large value
+    rounds = columns - np.array([ord("A"), ord("X")], dtype=np.uint8)
+    invalid = rounds > 2
+    if invalid.any():
+        row = columns[invalid.any(axis=1).argmax()].tobytes().decode(errors="replace")
+        raise ValueError(f"invalid round {' '.join(row)!r}")
+    return rounds[:, 0].astype(np.intp) * 3 + rounds[:, 1]
+
+
+def _columns(chars: np.ndarray) -> np.ndarray | None:
+    """
+    Both columns of every round, viewed in place if every line has the form "A Y\n"
+    (the last one possibly without the line ending), else None
+    """
+    if len(chars) % 4 == 3:
+        chars = np.append(chars, np.uint8(ord("\n")))
+    if len(chars) % 4:
+        return None
+    rows = chars.reshape(-1, 4)
+    if (rows[:, 1] == ord(" ")).all() and (rows[:, 3] == ord("\n")).all():
+        return rows[:, ::2]
+    return None
 
 
 def _char_to_num(ch: str, offset: str) -> int:
@@ -29,11 +71,6 @@ def _calc_round_score(opponent_move: int, own_move: int) -> int:
     return (outcome + 1) % 3 * 3 + own_move
 
 
-def part1(strategy: list[tuple[str, str]]) -> int:
-    games = [(_char_to_num(ch1, "A"), _char_to_num(ch2, "X")) for ch1, ch2 in strategy]
-    return sum((_calc_round_score(opponent, own)) for opponent, own in games)
-
-
 def _find_round_move_for_outcome(opponent_move: int, desired_outcome: int):
     # map outcomes like above:
     # 0 => draw, 1 => win, 2 => lose
@@ -44,18 +81,48 @@ def _find_round_move_for_outcome(opponent_move: int, desired_outcome: int):
     return (desired_outcome + opponent_move) % 3 or 3  # (instead of 0 we want 3)
 
 
-def part2(strategy: list[tuple[str, str]]) -> int:
-    games = [(_char_to_num(ch1, "A"), _char_to_num(ch2, "X")) for ch1, ch2 in strategy]
-    games = [
-        (opponent_move, _find_round_move_for_outcome(opponent_move, desired_outcome))
-        for opponent_move, desired_outcome in games
-    ]
-    return sum((_calc_round_score(opponent, own)) for opponent, own in games)
+def _score_table() -> np.ndarray:
+    """
+    Score of each of the 9 possible rounds, for both meanings of the second column:
+    the own move (part 1) and the desired outcome (part 2)
+    """
+    table = np.zeros((2, 9), dtype=np.int64)
+    for opponent in "ABC":
+        for column in "XYZ":
+            opponent_move = _char_to_num(opponent, "A")
+            own_move = _char_to_num(column, "X")
+            round_code = (opponent_move - 1) * 3 + own_move - 1
+            outcome_move = _find_round_move_for_outcome(opponent_move, own_move)
+            table[0, round_code] = _calc_round_score(opponent_move, own_move)
+            table[1, round_code] = _calc_round_score(opponent_move, outcome_move)
+    return table
+
+
+SCORES = _score_table()
+
+
+def scores(rounds: np.ndarray) -> tuple[int, int]:
+    """Total score of both parts: count how often each round occurs, then weigh it"""
+    part1_score, part2_score = SCORES @ np.bincount(rounds, minlength=9)
+    return int(part1_score), int(part2_score)
+
+
+def part1(rounds: np.ndarray) -> int:
+    return scores(rounds)[0]
+
+
+def part2(rounds: np.ndarray) -> int:
+    return scores(rounds)[1]
 
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 2).input_data)
+    return parse(load_input(2))
+
+
+@pytest.fixture()
+def example_input():
+    return parse("A Y\nB X\nC Z")
 
 
 def test_part1(puzzle_input):
@@ -64,3 +131,22 @@ def test_part1(puzzle_input):
 
 def test_part2(puzzle_input):
     assert part2(puzzle_input) == 12429
+
+
+def test_example_part1(example_input):
+    assert part1(example_input) == 15
+
+
+def test_example_part2(example_input):
+    assert part2(example_input) == 12
+
+
+def test_parse_whitespace():
+    assert parse("A Y\nB X\nC Z\n").tolist() == [1, 3, 8]
+    assert parse("A Y\r\nB X \r\n\nC Z\t\n").tolist() == [1, 3, 8]
+
+
+@pytest.mark.parametrize("data", ["A Y\nB", "A Y\nD X", "A Y\nB -"])
+def test_parse_invalid(data):
+    with pytest.raises(ValueError):
+        parse(data)
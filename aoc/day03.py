@@ -1,14 +1,9 @@
-import pytest
-from aocd.models import Puzzle
-
-
-def parse(data: str) -> list[str]:
-    return data.strip().splitlines()
+import string
 
+import numpy as np
+import pytest
 
-def _half_half(line: str):
-    n = len(line) // 2
-    return line[:n], line[n:]
+from aoc.inputs import load_input
 
 
 def _to_priority(char: str):
@@ -17,31 +12,83 @@ def _to_priority(char: str):
     return ord(char) - ord("a") + 1
 
 
-def part1(rucksacks: list[str]) -> int:
-    contents = [_half_half(line) for line in rucksacks]
-    items = []
-    for compartment1, compartment2 in contents:
-        (common,) = set(compartment1) & set(compartment2)
-        items.append(common)
-    return sum(map(_to_priority, items))
+def _item_bits() -> np.ndarray:
+    """
+    Lookup table from byte to item, as a bit mask with only the bit of the item's
+    priority set. All other bytes (newlines) are no item at all
+    """
+    table = np.zeros(256, dtype=np.uint64)
+    for char in string.ascii_letters:
+        table[ord(char)] = 1 << _to_priority(char)
+    return table
+
+
+ITEM_BITS = _item_bits()
+
+
+def parse(data: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert all items to their bit masks in one go, and find the index of the first
+    item and of the newline ending each rucksack
+    """
+    chars = np.frombuffer((data.strip() + "\n").encode(), dtype=np.uint8)
+    ends = np.flatnonzero(chars == ord("\n"))
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    return ITEM_BITS[chars], starts, ends
+
+
+def _priorities(common: np.ndarray) -> np.ndarray:
+    """Priority of each single item bit mask, which is the position of its bit"""
+    # frexp is exact for powers of two: 2 ** p = 0.5 * 2 ** (p + 1)
+    return np.frexp(common.astype(np.float64))[1] - 1
 
 
-def part2(rucksacks: list[str]) -> int:
-    items = []
-    for items1, items2, items3 in zip(rucksacks[::3], rucksacks[1::3], rucksacks[2::3]):
-        (common,) = set(items1) & set(items2) & set(items3)
-        items.append(common)
-    return sum(map(_to_priority, items))
+def part1(items: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> int:
+    middles = (starts + ends) // 2
+    # the second compartment reaches until the next rucksack, including the newline
+    compartments = np.bitwise_or.reduceat(
+        items, np.stack([starts, middles], axis=1).ravel()
+    )
+    common = compartments[0::2] & compartments[1::2]
+    return int(_priorities(common).sum())
+
+
+def part2(items: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> int:
+    rucksacks = np.bitwise_or.reduceat(items, starts)
+    common = np.bitwise_and.reduce(rucksacks.reshape(-1, 3), axis=1)
+    return int(_priorities(common).sum())
 
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 3).input_data)
+    return parse(load_input(3))
+
+
+@pytest.fixture()
+def example_input():
+    return parse(
+        """
+vJrwpWtwJgWrhcsFMMfFFhFp
+jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL
+PmmdzqPrVvPwwTWBwg
+wMqvLMZHhHMvwLHjbvcjnnSBnvTQFn
+ttgJtRGJQctTZtZT
+CrZsJsPPZsGzwwsLwLmpwMDw
+        """.strip()
+    )
 
 
 def test_part1(puzzle_input):
-    assert part1(puzzle_input) == 7824
+    assert part1(*puzzle_input) == 7824
 
 
 def test_part2(puzzle_input):
-    assert part2(puzzle_input) == 2798
+    assert part2(*puzzle_input) == 2798
+
+
+def test_example_part1(example_input):
+    assert part1(*example_input) == 157
+
+
+def test_example_part2(example_input):
+    assert part2(*example_input) == 70
@@ -1,35 +1,110 @@
-import re
-
+import numpy as np
 import pytest
-from aocd.models import Puzzle
 
+from aoc.inputs import load_input
+from aoc.jit import njit
 
-def parse(data: str) -> list[tuple[range, range]]:
-    ranges = []
-    for line in data.strip().splitlines():
-        a0, a1, b0, b1 = map(int, re.findall(r"\d+", line))
-        ranges.append((set(range(a0, a1 + 1)), set(range(b0, b1 + 1))))
-    return ranges
 
+def parse(data: str) -> np.ndarray:
+    """
+    Parse all pairs of section assignments into an array of their bounds
 
-def _part_x(ranges: list[tuple[range, range]], comparison_operator):
-    return sum(
-        1 if (comparison_operator(a, b) or comparison_operator(b, a)) else 0
-        for a, b in ranges
-    )
+    2-4,6-8
+    2-3,4-5
+
+    > [[2, 4, 6, 8],
+       [2, 3, 4, 5]]
+    """
+    numbers = data.strip().replace("-", " ").replace(",", " ")
+    return np.fromstring(numbers, dtype=np.int64, sep=" ").reshape(-1, 4)
+
+
+def contains(pairs: np.ndarray) -> np.ndarray:
+    """Whether one assignment of each pair fully contains the other one"""
+    a0, a1, b0, b1 = pairs.T
+    return ((a0 <= b0) & (b1 <= a1)) | ((b0 <= a0) & (a1 <= b1))
+
+
+def overlaps(pairs: np.ndarray) -> np.ndarray:
+    """Whether the assignments of each pair have at least one section in common"""
+    a0, a1, b0, b1 = pairs.T
+    return (a0 <= b1) & (b0 <= a1)
+
+
+def count_overlapping_pairs(ranges: np.ndarray) -> int:
+    """
+    Number of pairs among all given ranges (an N x 2 array of bounds) which have at
+    least one section in common. Counts the disjoint pairs instead: a range is
+    disjoint from all ranges starting after its end, found with a binary search
+    """
+    n = len(ranges)
+    starts = np.sort(ranges[:, 0])
+    after = n - np.searchsorted(starts, ranges[:, 1], side="right")
+    return n * (n - 1) // 2 - int(after.sum())
+
+
+@njit("int64(int64[:])")
+def _count_earlier_at_least(ranks: np.ndarray) -> int:
+    """
+    Count the pairs i < j with ranks[i] >= ranks[j], for ranks between 0 and n - 1,
+    using a Fenwick tree of how many earlier values have each rank
+    """
+    n = len(ranks)
+    tree = np.zeros(n + 1, dtype=np.int64)
+    total = 0
+    for i in range(n):
+        smaller = 0  # earlier values with a smaller rank
+        k = ranks[i]
+        while k > 0:
+            smaller += tree[k]
+            k -= k & -k
+        total += i - smaller
+
+        k = ranks[i] + 1
+        while k <= n:
+            tree[k] += 1
+            k += k & -k
+    return total
+
+
+def count_containing_pairs(ranges: np.ndarray) -> int:
+    """
+    Number of pairs among all given ranges (an N x 2 array of bounds) in which one
+    range fully contains the other one
+
+    Ordered by start and then by descending end, a range is contained in exactly
+    those earlier ranges which end at or after its own end.
+    """
+    order = np.lexsort((-ranges[:, 1], ranges[:, 0]))
+    _, end_ranks = np.unique(ranges[order, 1], return_inverse=True)
+    return _count_earlier_at_least(end_ranks.astype(np.int64))
 
 
-def part1(ranges: list[tuple[range, range]]) -> int:
-    return _part_x(ranges, set.issubset)
+def part1(pairs: np.ndarray) -> int:
+    return int(contains(pairs).sum())
 
 
-def part2(ranges: list[tuple[range, range]]) -> int:
-    return _part_x(ranges, set.intersection)
+def part2(pairs: np.ndarray) -> int:
+    return int(overlaps(pairs).sum())
 
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 4).input_data)
+    return parse(load_input(4))
+
+
+@pytest.fixture()
+def example_input():
+    return parse(
+        """
+2-4,6-8
+2-3,4-5
+5-7,7-9
+2-8,3-7
+6-6,4-6
+2-6,4-8
+        """.strip()
+    )
 
 
 def test_part1(puzzle_input):
@@ -38,3 +113,35 @@ def test_part1(puzzle_input):
 
 def test_part2(puzzle_input):
     assert part2(puzzle_input) == 847
+
+
+def test_example_part1(example_input):
+    assert part1(example_input) == 2
+
+
+def test_example_part2(example_input):
+    assert part2(example_input) == 4
+
+
+def test_wide_ranges():
+    pairs = parse("1-1000000000,5-999999999\n1-2,1000000000-1000000001")
+    assert contains(pairs).tolist() == [True, False]
+    assert overlaps(pairs).tolist() == [True, False]
+
+
+def _count_pairs_brute_force(ranges: np.ndarray) -> tuple[int, int]:
+    pairs = np.array(
+        [(*a, *b) for i, a in enumerate(ranges) for b in ranges[i + 1 :]]
+    ).reshape(-1, 4)
+    return int(overlaps(pairs).sum()), int(contains(pairs).sum())
+
+
+def test_count_pairs(example_input):
+    rng = np.random.default_rng(0)
+    starts = rng.integers(0, 50, 300)
+    random_ranges = np.stack([starts, starts + rng.integers(0, 20, 300)], axis=1)
+
+    for ranges in (example_input.reshape(-1, 2), random_ranges, random_ranges[:1]):
+        overlapping, containing = _count_pairs_brute_force(ranges)
+        assert count_overlapping_pairs(ranges) == overlapping
+        assert count_containing_pairs(ranges) == containing
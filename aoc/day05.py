@@ -1,8 +1,10 @@
+import random
 import re
-from collections import defaultdict
+from typing import Iterable
 
 import pytest
-from aocd.models import Puzzle
+
+from aoc.inputs import load_input
 
 Stacks = dict[int, list[str]]
 Moves = list[tuple[int, int, int]]
@@ -15,8 +17,10 @@ def _ints(line: str) -> tuple[int, ...]:
 def parse(data: str) -> tuple[Stacks, Moves]:
     starting_stacks, moves = data.split("\n\n")
 
-    stacks = defaultdict(list)
-    for line in starting_stacks.splitlines()[-2::-1]:
+    lines = starting_stacks.splitlines()
+    # the numbering line lists all stacks, including the ones which start empty
+    stacks = {i: [] for i in _ints(lines[-1])}
+    for line in lines[-2::-1]:
         for i, offset in enumerate(range(1, len(line), 4)):
             if line[offset].strip():
                 stacks[i + 1].append(line[offset])
@@ -25,29 +29,99 @@ def parse(data: str) -> tuple[Stacks, Moves]:
     return stacks, moves
 
 
-def _stack_tops(stacks: Stacks) -> str:
-    return "".join(stacks[i][-1] for i in sorted(stacks.keys()))
+def _stack_numbers(stacks: Stacks, moves: Moves) -> list[int]:
+    """All stacks which are given or used by a move, even if they are empty"""
+    used = {i for _, src, dest in moves for i in (src, dest)}
+    return sorted(set(stacks) | used)
 
 
-def part1(stacks: Stacks, moves: Moves) -> str:
+class CrateStack:
+    """
+    A stack of crates from bottom to top. Crates are taken and put in bulk with
+    slices of the underlying list, so moving many crates at once needs no Python
+    work per crate, and taking a few crates off a tall stack doesn't copy the rest
+    """
+
+    def __init__(self, crates: Iterable[str] = ()):
+        self.crates = list(crates)
+
+    def __len__(self) -> int:
+        return len(self.crates)
+
+    def top(self) -> str:
+        return self.crates[-1] if self.crates else ""
+
+    def take(self, n: int) -> list[str]:
+        """Remove the n topmost crates, returning them from bottom to top"""
+        start = len(self.crates) - n
+        try:
+            return self.crates[start:]
+        finally:
+            del self.crates[start:]
+
+    def put(self, crates: list[str]):
+        """Put crates (from bottom to top) onto the stack"""
+        self.crates.extend(crates)
+
+
+def _crane(stacks: Stacks, moves: Moves, reverse: bool) -> str:
+    """
+    Run all moves and return the crates on top of the stacks. A crane which moves
+    crates one at a time (reverse=True) reverses the order of the moved crates
+    """
+    crate_stacks = {
+        i: CrateStack(stacks.get(i, ())) for i in _stack_numbers(stacks, moves)
+    }
     for n, src, dest in moves:
-        for _ in range(n):
-            stacks[dest].append(stacks[src].pop())
+        crates = crate_stacks[src].take(n)
+        crate_stacks[dest].put(crates[::-1] if reverse else crates)
 
-    return _stack_tops(stacks)
+    return "".join(crate_stacks[i].top() for i in sorted(crate_stacks))
 
 
-def part2(stacks: Stacks, moves: Moves) -> str:
+def trace_tops(stacks: Stacks, moves: Moves, reverse: bool) -> str:
+    """
+    Same as _crane, but without moving any crates: the position (stack, depth below
+    the top) of each final top crate is followed backwards through the moves, to the
+    position the crate had in the starting stacks
+    """
+    numbers = _stack_numbers(stacks, moves)
+    heights = {i: len(stacks.get(i, ())) for i in numbers}
     for n, src, dest in moves:
-        stacks[dest].extend(stacks[src][-n:])
-        del stacks[src][-n:]
+        heights[src] -= n
+        heights[dest] += n
+
+    tops = []
+    for i in numbers:
+        if heights[i] == 0:  # no crate ends up on this stack
+            continue
+        stack, depth = i, 0
+        for n, src, dest in reversed(moves):
+            if src == dest:  # the crates are put back onto the stack they came from
+                if stack == src and depth < n and reverse:
+                    depth = n - 1 - depth
+            elif stack == dest and depth < n:  # the crate was moved by this move
+                stack, depth = src, n - 1 - depth if reverse else depth
+            elif stack == dest:
+                depth -= n
+            elif stack == src:
+                depth += n
+        tops.append(stacks[stack][-1 - depth])
+
+    return "".join(tops)
 
-    return _stack_tops(stacks)
+
+def part1(stacks: Stacks, moves: Moves) -> str:
+    return _crane(stacks, moves, reverse=True)  # the CrateMover 9000
+
+
+def part2(stacks: Stacks, moves: Moves) -> str:
+    return _crane(stacks, moves, reverse=False)  # the CrateMover 9001
 
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 5).input_data)
+    return parse(load_input(5))
 
 
 @pytest.fixture()
@@ -81,3 +155,64 @@ def test_part2(puzzle_input):
 
 def test_example_part2(example_input):
     assert part2(*example_input) == "MCD"
+
+
+def test_example_parts_share_input(example_input):
+    assert part1(*example_input) == "CMZ"
+    assert part2(*example_input) == "MCD"
+    assert part1(*example_input) == "CMZ"
+
+
+def test_crate_stack():
+    stack = CrateStack("ZN")
+    stack.put(list("ABC"))
+    assert stack.take(4) == list("NABC")
+    assert (len(stack), stack.top()) == (1, "Z")
+    assert stack.take(1) == ["Z"]
+    assert (len(stack), stack.top()) == (0, "")
+
+
+def test_move_to_empty_stack():
+    stacks, moves = parse(
+        "[A] [D]    \n[B] [C]    \n 1   2   3 \n\nmove 1 from 1 to 3\n"
+    )
+    assert stacks[3] == []
+    assert part1(stacks, moves) == part2(stacks, moves) == "BDA"
+
+
+def test_take_keeps_the_stack():
+    # taking a few crates off a tall stack must not copy the rest of the stack
+    stack = CrateStack(["A"] * 100000 + ["B"])
+    crates = stack.crates
+    assert stack.take(2) == ["A", "B"]
+    assert stack.crates is crates
+    assert len(crates) == 99999
+
+
+def test_trace_tops(example_input):
+    assert trace_tops(*example_input, reverse=True) == "CMZ"
+    assert trace_tops(*example_input, reverse=False) == "MCD"
+
+    # stacks which start empty may be left out of the given stacks
+    stacks, moves = {1: ["B", "A"], 2: ["C", "D"]}, [(1, 1, 3)]
+    assert trace_tops(stacks, moves, reverse=True) == "BDA"
+    assert trace_tops(stacks, moves, reverse=False) == "BDA"
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_trace_tops_random(seed):
+    rng = random.Random(seed)
+    stacks = {i: rng.choices("ABCDEFG", k=rng.randint(0, 5)) for i in range(1, 5)}
+    heights = {i: len(stack) for i, stack in stacks.items()}
+    moves = []
+    for _ in range(rng.randint(1, 30)):
+        if not any(heights.values()):
+            break
+        src, dest = rng.choice([i for i in heights if heights[i]]), rng.randint(1, 4)
+        n = rng.randint(1, heights[src])
+        heights[src] -= n
+        heights[dest] += n
+        moves.append((n, src, dest))
+
+    for reverse in (True, False):
+        assert trace_tops(stacks, moves, reverse) == _crane(stacks, moves, reverse)
@@ -1,25 +1,112 @@
-import pytest
-from aocd.models import Puzzle
+import io
+from typing import BinaryIO, Iterable, Iterator
 
+import numpy as np
+import pytest
 
-def _find(data: str, n: int = 4) -> int:
-    for i in range(len(data) - n):
-        if len(set(data[i : i + n])) == n:
-            return i + n
-    return -1
+from aoc.inputs import load_input
+
+CHUNK_SIZE = 1024 * 1024  # bytes read at once by stream_markers
+
+
+def find_markers(data: str, sizes: Iterable[int] = (4, 14)) -> dict[int, int]:
+    """
+    Find the first marker of each of the given sizes in a single pass over the data,
+    returning the number of characters up to and including each marker (-1 if there
+    is none)
+
+    The longest window without a duplicate that ends at the current character starts
+    right after the last occurrence of any character in it, so it is enough to track
+    where each character was last seen.
+    """
+    sizes = sorted(set(sizes))
+    markers = {size: -1 for size in sizes}
+    last_seen = {}
+    run_start = 0  # start of the longest window without duplicates
+    for i, char in enumerate(data):
+        run_start = max(run_start, last_seen.get(char, -1) + 1)
+        last_seen[char] = i
+        while sizes and i - run_start + 1 >= sizes[0]:
+            markers[sizes.pop(0)] = i + 1
+        if not sizes:
+            break
+    return markers
+
+
+def _previous_occurrence(chars: np.ndarray) -> np.ndarray:
+    """Index of the previous occurrence of the same value, for every value (or -1)"""
+    order = np.argsort(chars, kind="stable")
+    previous = np.full(len(chars), -1, dtype=np.int64)
+    same = chars[order[1:]] == chars[order[:-1]]
+    previous[order[1:][same]] = order[:-1][same]
+    return previous
+
+
+def stream_markers(
+    stream: BinaryIO,
+    sizes: Iterable[int] = (4, 14),
+    chunk_size: int = CHUNK_SIZE,
+    find_all: bool = False,
+) -> Iterator[tuple[int, int]]:
+    """
+    Scan a binary stream (e.g. a file or pipe) for markers chunk by chunk, yielding
+    (size, offset) for the first marker of each size, or for every marker if
+    find_all is set. Offsets are the number of bytes from the start of the stream
+    up to and including the marker, as in find_markers
+
+    Only the position each byte value was last seen at and the start of the current
+    window without duplicates are carried from one chunk to the next, so memory use
+    does not depend on the length of the stream.
+    """
+    pending = sorted(set(sizes))
+    last_seen = np.full(256, -1, dtype=np.int64)
+    run_start = 0
+    offset = 0
+    while pending and (chunk := stream.read(chunk_size)):
+        chars = np.frombuffer(chunk, dtype=np.uint8)
+        positions = offset + np.arange(len(chars))
+
+        previous = _previous_occurrence(chars)
+        previous = np.where(previous >= 0, previous + offset, last_seen[chars])
+        run_starts = np.maximum(np.maximum.accumulate(previous + 1), run_start)
+        run_lengths = positions - run_starts + 1
+
+        found = []
+        for size in list(pending):
+            ends = positions[run_lengths >= size] + 1
+            if not find_all and len(ends):
+                ends = ends[:1]
+                pending.remove(size)
+            found += [(int(end), size) for end in ends]
+        yield from ((size, end) for end, size in sorted(found))
+
+        values, last = np.unique(chars[::-1], return_index=True)
+        last_seen[values] = positions[::-1][last]
+        run_start = run_starts[-1]
+        offset += len(chars)
+
+
+def find_markers_vectorized(
+    data: bytes, sizes: Iterable[int] = (4, 14)
+) -> dict[int, int]:
+    """Same as find_markers, computing the windows for all positions at once"""
+    markers = {size: -1 for size in sizes}
+    stream = io.BytesIO(data)
+    markers.update(stream_markers(stream, sizes, chunk_size=max(len(data), 1)))
+    return markers
 
 
 def part1(data: str) -> int:
-    return _find(data, 4)
+    return find_markers(data, (4,))[4]
 
 
 def part2(data: str) -> int:
-    return _find(data, 14)
+    return find_markers(data, (14,))[14]
 
 
 @pytest.fixture()
 def puzzle_input() -> str:
-    return Puzzle(2022, 6).input_data
+    return load_input(6)
 
 
 @pytest.fixture()
@@ -41,3 +128,42 @@ def test_part2(puzzle_input):
 
 def test_example_part2(example_input):
     assert part2(example_input) == 23
+
+
+EXAMPLES = {
+    "mjqjpqmgbljsphdztnvjfqwrcgsmlb": (7, 19),
+    "bvwbjplbgvbhsrlpgdmjqwftvncz": (5, 23),
+    "nppdvjthqldpwncqszvftbrmjlhg": (6, 23),
+    "nznrnfrfntjfmvfwmzdfjlvtqnbhcprsg": (10, 29),
+    "zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw": (11, 26),
+}
+
+
+def test_find_markers():
+    for data, (start_of_packet, start_of_message) in EXAMPLES.items():
+        expected = {4: start_of_packet, 14: start_of_message}
+        assert find_markers(data) == expected
+        assert find_markers_vectorized(data.encode()) == expected
+
+
+def test_marker_at_the_end():
+    assert find_markers("aaaabcd", (4, 5)) == {4: 7, 5: -1}
+    assert find_markers_vectorized(b"aaaabcd", (4, 5)) == {4: 7, 5: -1}
+    assert find_markers_vectorized(b"", (4,)) == {4: -1}
+
+
+def test_stream_markers():
+    data = "".join(EXAMPLES).encode()
+    expected = list(stream_markers(io.BytesIO(data), (4, 14), chunk_size=len(data)))
+    assert expected == [(4, 7), (14, 19)]
+    for chunk_size in (1, 3, 16):
+        stream = io.BytesIO(data)
+        assert list(stream_markers(stream, (4, 14), chunk_size)) == expected
+
+    every = list(stream_markers(io.BytesIO(data), (14,), 1, find_all=True))
+    assert every[0] == (14, 19)
+    assert every == list(stream_markers(io.BytesIO(data), (14,), 7, find_all=True))
+    brute_force = [
+        i for i in range(14, len(data) + 1) if len(set(data[i - 14 : i])) == 14
+    ]
+    assert [end for _, end in every] == brute_force
@@ -1,56 +1,243 @@
-from collections import defaultdict
+import heapq
+import sys
+from typing import Iterable
 
+import numpy as np
 import pytest
-from aocd.models import Puzzle
+
+from aoc.inputs import load_input
+
+FILESYSTEM_SIZE = 70000000
+REQUIRED_DISK_SPACE = 30000000
 
 
 def parse(data: str) -> list[str]:
     return data.strip().splitlines()
 
 
-def _directory_sizes(lines: list[str]) -> dict[str, int]:
-    directory_sizes = defaultdict(int)
+class FileTree:
+    """
+    The directories of a terminal transcript as a tree. Directories are numbered in
+    the order they are discovered, with the root as 0, and each one stores the number
+    of its parent, so every directory has a larger number than its parent
+    """
+
+    def __init__(self):
+        self.parents = [-1]
+        self.names = [sys.intern("/")]
+        self.own_sizes = [0]  # sizes of the files directly inside each directory
+        self.children: dict[tuple[int, str], int] = {}  # (parent, name) -> directory
+        self.cwd = 0
+
+    def __len__(self) -> int:
+        return len(self.parents)
 
-    for line in lines:
-        match line.split():
-            case "$", "cd", "/":
-                directories = ["/"]
-            case "$", "cd", "..":
-                directories.pop()
-            case "$", "cd", dir_name:
-                directories.append(directories[-1] + dir_name + "/")
-            case "$", "ls":
-                continue
-            case "dir", _:
+    def feed(self, lines: Iterable[str]):
+        """Follow the given transcript lines, starting in the current directory"""
+        for line in lines:
+            match line.split():
+                case "$", "cd", "/":
+                    self.cwd = 0
+                case "$", "cd", "..":
+                    if self.cwd > 0:  # like in a shell, the root is its own parent
+                        self.cwd = self.parents[self.cwd]
+                case "$", "cd", dir_name:
+                    self.cwd = self._directory(self.cwd, dir_name)
+                case "$", "ls":
+                    continue
+                case "dir", dir_name:
+                    self._directory(self.cwd, dir_name)
+                case file_size, _:
+                    self._add_file(self.cwd, int(file_size))
+
+    def _directory(self, parent: int, name: str) -> int:
+        """The directory with the given name inside of parent, created if necessary"""
+        key = (parent, sys.intern(name))
+        directory = self.children.get(key)
+        if directory is None:
+            directory = len(self.parents)
+            self.parents.append(parent)
+            self.names.append(key[1])
+            self.own_sizes.append(0)
+            self.children[key] = directory
+        return directory
+
+    def _add_file(self, directory: int, size: int):
+        self.own_sizes[directory] += size
+
+    def path(self, directory: int) -> str:
+        names = []
+        while directory > 0:
+            names.append(self.names[directory])
+            directory = self.parents[directory]
+        return "/" + "".join(f"{name}/" for name in reversed(names))
+
+    def sizes(self) -> np.ndarray:
+        """
+        Total size of every directory, in a single pass from the last discovered
+        directory to the root: all subdirectories of a directory are done before it
+        """
+        totals = list(self.own_sizes)
+        parents = self.parents
+        for directory in range(len(totals) - 1, 0, -1):
+            totals[parents[directory]] += totals[directory]
+        return np.array(totals, dtype=np.int64)
+
+
+class _Totals:
+    """
+    Multiset of non-negative integers below 2**BITS, as a Fenwick tree over all of
+    these values. The tree is stored sparsely in a dict from node to the number and
+    sum of the values it covers, so adding or removing a value, summing all values up
+    to a limit and finding the k-th smallest value each visit at most BITS nodes
+    """
+
+    BITS = 48
+
+    def __init__(self):
+        self.nodes: dict[int, list[int]] = {}  # node -> [count, sum]
+        self.count = 0
+
+    def add(self, value: int, count: int = 1):
+        """Add count copies of value, or remove them if count is negative"""
+        if not 0 <= value < 1 << self.BITS:
+            raise ValueError(f"{value} is out of range")
+        self.count += count
+        node = value + 1
+        while node <= 1 << self.BITS:
+            entry = self.nodes.setdefault(node, [0, 0])
+            entry[0] += count
+            entry[1] += count * value
+            if not entry[0]:  # the sum is 0 as well, all values are non-negative
+                del self.nodes[node]
+            node += node & -node
+
+    def at_most(self, limit: int) -> tuple[int, int]:
+        """Number and sum of the values which are at most limit"""
+        count = total = 0
+        node = min(limit + 1, 1 << self.BITS)
+        while node > 0:
+            entry = self.nodes.get(node)
+            if entry:
+                count += entry[0]
+                total += entry[1]
+            node -= node & -node
+        return count, total
+
+    def kth(self, k: int) -> int:
+        """The k-th smallest value, counted from 1"""
+        node = 0
+        for bit in reversed(range(self.BITS + 1)):
+            child = node + (1 << bit)
+            count = self.nodes.get(child, (0,))[0]
+            if child <= 1 << self.BITS and count < k:
+                node = child
+                k -= count
+        return node  # the value is the node after it, minus one
+
+
+class DirectorySizeIndex(FileTree):
+    """
+    A FileTree which keeps the total size of every directory up to date while lines
+    are fed to it, e.g. from a growing terminal log, and keeps all totals in a _Totals
+    tree to answer queries about them in logarithmic time
+
+    The totals are updated once per call of feed: only the directories which got new
+    files and their ancestors change, each in logarithmic time.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.totals = [0]
+        self._tree = _Totals()
+        self._tree.add(0)
+        self._new = []  # directories created during the current feed
+        self._added = {}  # directory -> size of the files added during the feed
+
+    def _directory(self, parent: int, name: str) -> int:
+        n_directories = len(self)
+        directory = super()._directory(parent, name)
+        if len(self) > n_directories:  # a new, still empty directory
+            self.totals.append(0)
+            self._new.append(directory)
+        return directory
+
+    def _add_file(self, directory: int, size: int):
+        super()._add_file(directory, size)
+        self._added[directory] = self._added.get(directory, 0) + size
+
+    def feed(self, lines: Iterable[str]):
+        super().feed(lines)
+        changes = self._propagate(self._added)
+        new, self._new, self._added = self._new, [], {}
+
+        if new:
+            self._tree.add(0, len(new))
+        for directory, size in changes.items():
+            total = self.totals[directory]
+            self._tree.add(total, -1)
+            self._tree.add(total + size)
+            self.totals[directory] = total + size
+
+    def _propagate(self, added: dict[int, int]) -> dict[int, int]:
+        """
+        How much the total of each directory grows, given the sizes added directly to
+        some of them. Directories are visited from the largest number down, so each
+        one is complete before it is added to its parent
+        """
+        changes = dict(added)
+        queue = [-directory for directory in changes]
+        heapq.heapify(queue)
+        while queue:
+            directory = -heapq.heappop(queue)
+            parent = self.parents[directory]
+            if parent < 0:
                 continue
-            case file_size, _:
-                for directory in directories:
-                    directory_sizes[directory] += int(file_size)
+            if parent not in changes:
+                changes[parent] = 0
+                heapq.heappush(queue, -parent)
+            changes[parent] += changes[directory]
+        return changes
+
+    def sizes(self) -> np.ndarray:
+        return np.array(self.totals, dtype=np.int64)
+
+    def sum_at_most(self, limit: int) -> int:
+        """Sum of the totals of all directories with a total of at most limit"""
+        return self._tree.at_most(limit)[1]
 
-    return directory_sizes
+    def smallest_at_least(self, size: int) -> int | None:
+        """Smallest total of a directory which is at least size, if there is one"""
+        smaller = self._tree.at_most(size - 1)[0] if size > 0 else 0
+        return self._tree.kth(smaller + 1) if smaller < self._tree.count else None
+
+
+def _directory_sizes(lines: list[str]) -> np.ndarray:
+    """Total size of every directory, the root first"""
+    tree = FileTree()
+    tree.feed(lines)
+    return tree.sizes()
 
 
 def part1(lines: list[str]) -> int:
     sizes = _directory_sizes(lines)
-    return sum(val for val in sizes.values() if val <= 100000)
+    return int(sizes[sizes <= 100000].sum())
 
 
 def part2(lines: list[str]) -> int:
     sizes = _directory_sizes(lines)
 
-    filesystem_size = 70000000
-    required_disk_space = 30000000
-    used_disk_space = sizes["/"]
+    used_disk_space = sizes[0]
+    unused_space = FILESYSTEM_SIZE - used_disk_space
+    to_delete = REQUIRED_DISK_SPACE - unused_space
 
-    unused_space = filesystem_size - used_disk_space
-    to_delete = required_disk_space - unused_space
-
-    return min(val for val in sizes.values() if val >= to_delete)
+    # directories without any files (which the tree includes as well) don't count
+    return int(sizes[(sizes >= to_delete) & (sizes > 0)].min())
 
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 7).input_data)
+    return parse(load_input(7))
 
 
 @pytest.fixture()
@@ -98,3 +285,89 @@ def test_part2(puzzle_input):
 
 def test_example_part2(example_input):
     assert part2(example_input) == 24933642
+
+
+def test_part2_nothing_to_delete():
+    lines = parse("$ cd /\n$ ls\ndir a\ndir b\n10 c\n$ cd a\n$ ls\n5 d\ndir e")
+    assert _directory_sizes(lines).tolist() == [15, 5, 0, 0]
+    assert part2(lines) == 5  # the smallest directory with files, not an empty one
+
+
+def test_file_tree(example_input):
+    tree = FileTree()
+    tree.feed(example_input)
+    assert [tree.path(directory) for directory in range(len(tree))] == [
+        "/",
+        "/a/",
+        "/d/",
+        "/a/e/",
+    ]
+    assert tree.sizes().tolist() == [48381165, 94853, 24933642, 584]
+
+
+def test_cd_up_from_root():
+    lines = parse("$ cd /\n$ ls\ndir a\n$ cd a\n$ cd ..\n$ cd ..\n$ ls\n10 b")
+    assert _directory_sizes(lines).tolist() == [10, 0]
+    index = DirectorySizeIndex()
+    index.feed(lines)
+    assert index.sizes().tolist() == [10, 0]
+
+
+def test_directory_size_index(example_input):
+    index = DirectorySizeIndex()
+    for i in range(0, len(example_input), 5):  # feed the transcript piece by piece
+        index.feed(example_input[i : i + 5])
+        sizes = _directory_sizes(example_input[: i + 5])
+        assert index.sizes().tolist() == sizes.tolist()
+        assert index.sum_at_most(100000) == sizes[sizes <= 100000].sum()
+
+    assert index.sum_at_most(100000) == 95437
+    assert index.smallest_at_least(8381165) == 24933642
+    assert index.smallest_at_least(0) == 584
+    assert index.smallest_at_least(10**9) is None
+
+
+def test_totals():
+    totals = _Totals()
+    values = [5, 0, 17, 5, 2**40, 3]
+    for value in values:
+        totals.add(value)
+    totals.add(17, -1)
+    values.remove(17)
+    for limit in [0, 2, 3, 5, 16, 17, 2**40, 2**48]:
+        at_most = [value for value in values if value <= limit]
+        assert totals.at_most(limit) == (len(at_most), sum(at_most))
+    assert [totals.kth(k) for k in range(1, 6)] == sorted(values)
+    assert len(totals.nodes) < 5 * _Totals.BITS
+
+    with pytest.raises(ValueError):
+        totals.add(-1)
+
+
+def test_directory_size_index_many_directories():
+    lines = ["$ cd /", "$ ls", *(f"dir d{i}" for i in range(180_000))]
+    index = DirectorySizeIndex()
+    index.feed(lines)
+
+    visited = []
+
+    class Nodes(dict):  # records every node of the _Totals tree which is visited
+        def get(self, node, default=None):
+            visited.append(node)
+            return super().get(node, default)
+
+        def setdefault(self, node, default=None):
+            visited.append(node)
+            return super().setdefault(node, default)
+
+    index._tree.nodes = Nodes(index._tree.nodes)
+    n_nodes = _Totals.BITS + 1
+    # a file in a single directory changes its total and the one of the root
+    index.feed(["$ cd d7", "500 f", "$ cd .."])
+    assert len(visited) <= 4 * n_nodes
+    visited.clear()
+    assert index.sum_at_most(500) == 1000  # d7 and the root
+    assert len(visited) <= n_nodes
+    visited.clear()
+    assert index.smallest_at_least(1) == 500
+    assert len(visited) <= 2 * n_nodes
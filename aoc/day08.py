@@ -1,10 +1,18 @@
+from dataclasses import dataclass
+
 import numpy as np
 import pytest
-from aocd.models import Puzzle
+
+from aoc.inputs import load_input
+from aoc.jit import njit
+
+MAX_HEIGHT = 9
 
 
 def parse(data: str) -> np.ndarray:
-    return np.asarray([[int(v) for v in line] for line in data.strip().split()])
+    rows = data.strip().split()
+    digits = np.frombuffer("".join(rows).encode(), dtype=np.uint8) - ord("0")
+    return digits.astype(np.int8).reshape(len(rows), -1)
 
 
 def _visible_from_top(forest: np.ndarray) -> np.ndarray:
@@ -18,59 +26,122 @@ def _visible_from_top(forest: np.ndarray) -> np.ndarray:
     return forest > np.maximum.accumulate(padded)[:-1, :]
 
 
+def _visible_from_edges(forest: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Which trees are visible from the top, bottom, left and right edge"""
+    # Reuse the visible from top function for all directions by flipping and transposing
+    # the array accordingly:
+    return (
+        _visible_from_top(forest),  # from top
+        _visible_from_top(forest[::-1, :])[::-1, :],  # from bottom
+        _visible_from_top(forest.T).T,  # from left
+        _visible_from_top(forest[:, ::-1].T).T[:, ::-1],  # from right
+    )
+
+
 def part1(forest: np.ndarray) -> int:
     """
     Count how many trees are visible from any of the four directions
     """
-    visible = np.zeros_like(forest)
-    # Reuse the visible from top function for all directions by flipping and transposing
-    # the array accordingly:
-    visible |= _visible_from_top(forest)  # from top
-    visible |= _visible_from_top(forest.T).T  # from left
-    visible |= _visible_from_top(forest[::-1, :])[::-1, :]  # from bottom
-    visible |= _visible_from_top(forest[:, ::-1].T).T[:, ::-1]  # from right
+    return int(np.logical_or.reduce(_visible_from_edges(forest)).sum())
+
+
+@njit("int32[:, :](int8[:, :])")
+def _viewing_distance_up(forest: np.ndarray) -> np.ndarray:
+    """
+    How many trees each tree can see when looking up, in a single sweep over the rows
 
-    return visible.sum()
+    For every height and column the sweep remembers the last row with a tree at
+    least that high: looking up from a tree, the view ends at the last tree which is
+    at least as high as the tree itself, or at the edge (row 0).
+    """
+    height, width = forest.shape
+    last_at_least = np.zeros((width, MAX_HEIGHT + 1), dtype=np.int32)
+    distances = np.empty((height, width), dtype=np.int32)
+    for y in range(height):
+        for x in range(width):
+            tree = forest[y, x]
+            distances[y, x] = y - last_at_least[x, tree]
+            for h in range(tree + 1):
+                last_at_least[x, h] = y
+    return distances
+
+
+@njit("int32[:, :](int8[:, :])")
+def _viewing_distance_left(forest: np.ndarray) -> np.ndarray:
+    """Same as _viewing_distance_up when looking left, sweeping along each row"""
+    height, width = forest.shape
+    distances = np.empty((height, width), dtype=np.int32)
+    for y in range(height):
+        last_at_least = np.zeros(MAX_HEIGHT + 1, dtype=np.int32)
+        for x in range(width):
+            tree = forest[y, x]
+            distances[y, x] = x - last_at_least[tree]
+            for h in range(tree + 1):
+                last_at_least[h] = x
+    return distances
+
+
+def _viewing_distances(forest: np.ndarray) -> tuple[np.ndarray, ...]:
+    """How many trees each tree can see when looking up, down, left and right"""
+    # Reuse the viewing distance up and left for all directions, like in part 1
+    return (
+        _viewing_distance_up(forest),  # up
+        _viewing_distance_up(forest[::-1, :])[::-1, :],  # down
+        _viewing_distance_left(forest),  # left
+        _viewing_distance_left(forest[:, ::-1])[:, ::-1],  # right
+    )
 
 
-def _scenic_score(forest: np.ndarray, y: int, x: int) -> int:
+def _scenic_scores(distances: tuple[np.ndarray, ...]) -> np.ndarray:
+    up, down, left, right = distances
+    return up.astype(np.int64) * down * left * right
+
+
+@dataclass
+class ViewingFields:
     """
-    Calculate the scenic score for a given position in the forest
+    Viewing distances and visibility from the edges of every tree in a forest, for
+    computing any kind of score with array operations
     """
-    own_height = forest[y, x]
-    up = forest[:y, x][::-1]  # 1d array of trees when looking up
-    left = forest[y, :x][::-1]  # 1d array of trees when looking left
-    right = forest[y, x + 1 :]  # 1d array of trees when looking right
-    down = forest[y + 1 :, x]  # 1d array of trees when looking down
 
-    def _view_distance(trees) -> int:
-        maxs = np.maximum.accumulate(trees)
-        return (own_height > maxs).sum() + (1 if maxs[-1] >= own_height else 0)
+    up: np.ndarray
+    down: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+    visible_from_top: np.ndarray
+    visible_from_bottom: np.ndarray
+    visible_from_left: np.ndarray
+    visible_from_right: np.ndarray
+
+    @property
+    def visible(self) -> np.ndarray:
+        """Which trees are visible from any edge"""
+        return (
+            self.visible_from_top
+            | self.visible_from_bottom
+            | self.visible_from_left
+            | self.visible_from_right
+        )
+
+    @property
+    def scenic_scores(self) -> np.ndarray:
+        return _scenic_scores((self.up, self.down, self.left, self.right))
 
-    return (
-        _view_distance(up)
-        * _view_distance(left)
-        * _view_distance(right)
-        * _view_distance(down)
-    )
+
+def viewing_fields(forest: np.ndarray) -> ViewingFields:
+    return ViewingFields(*_viewing_distances(forest), *_visible_from_edges(forest))
 
 
 def part2(forest: np.ndarray) -> int:
     """
     Find the maximum scenic score in a forest
     """
-    scenic_scores = np.zeros_like(forest)
-    for y in range(
-        1, forest.shape[0] - 1
-    ):  # we can skip the edges, they'll always be 0
-        for x in range(1, forest.shape[1] - 1):
-            scenic_scores[y, x] = _scenic_score(forest, y, x)
-    return scenic_scores.max()
+    return int(_scenic_scores(_viewing_distances(forest)).max())
 
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 8).input_data)
+    return parse(load_input(8))
 
 
 @pytest.fixture()
@@ -100,3 +171,14 @@ def test_part2(puzzle_input):
 
 def test_example_part2(example_input):
     assert part2(example_input) == 8
+
+
+def test_viewing_fields(example_input):
+    fields = viewing_fields(example_input)
+    # the tree in the middle of the fourth row
+    assert (fields.up[3, 2], fields.down[3, 2]) == (2, 1)
+    assert (fields.left[3, 2], fields.right[3, 2]) == (2, 2)
+    assert fields.scenic_scores[3, 2] == 8
+    assert fields.scenic_scores.max() == part2(example_input)
+    assert fields.visible.sum() == part1(example_input)
+    assert fields.visible_from_top[1, 1] and not fields.visible_from_bottom[1, 1]
@@ -1,79 +1,77 @@
-from itertools import chain
-
 import numpy as np
 import pytest
-from aocd.models import Puzzle
-from numba import complex128, int64, njit
 
-# use complex numbers to store 2d coordinates
-DIRECTIONS = {"U": -1 + 0j, "R": 0 + 1j, "D": 1 + 0j, "L": 0 - 1j}
+from aoc.grid import DOWN, LEFT, RIGHT, UP, OccupancyGrid
+from aoc.inputs import load_input
+from aoc.jit import njit
+
+DIRECTIONS = {"U": UP, "R": RIGHT, "D": DOWN, "L": LEFT}
 
 
-def parse(data: str) -> list[str]:
+def parse(data: str) -> np.ndarray:
     """
-    Generate a list of single character moves from a given input
+    Generate an array of single steps (dy, dx) from a given input
 
     R 3
     U 2
     D 2
 
-    > ["R", "R", "R", "U", "U", "D", "D"]
-
-    and convert them directly to their direction values
-
-    > [1j, 1j, 1j, -1, -1, 1, 1]
+    > [(0, 1), (0, 1), (0, 1), (-1, 0), (-1, 0), (1, 0), (1, 0)]
     """
     moves = [line.split(" ") for line in data.splitlines()]
-    moves = chain.from_iterable([direction] * int(times) for direction, times in moves)
-    moves = list(moves)
-    return np.fromiter(map(DIRECTIONS.__getitem__, moves), complex, len(moves))
+    directions = np.array([DIRECTIONS[direction] for direction, _ in moves], np.int64)
+    times = np.array([int(times) for _, times in moves], np.int64)
+    return np.repeat(directions.reshape(-1, 2), times, axis=0)
 
 
-@njit(complex128(complex128))
-def _direction_vec(val: complex) -> complex:
+@njit("void(int64[:, :], int64, boolean[:, :], int64, int64)")
+def _pull_rope(
+    steps: np.ndarray, n_knots: int, visited: np.ndarray, y0: int, x0: int
+) -> None:
     """
-    Clip the given value to a maximum the knot can move (1 vertical and 1 horizontal)
+    Move the head of a rope by the given steps, marking every position the tail
+    visits in an array whose cell [0, 0] is at position (y0, x0)
     """
-    return np.sign(val.real) + np.sign(val.imag) * 1j
+    knots = np.zeros((n_knots, 2), dtype=np.int64)
+    visited[-y0, -x0] = True
 
+    for i in range(len(steps)):
+        knots[0, 0] += steps[i, 0]
+        knots[0, 1] += steps[i, 1]
 
-@njit(int64(complex128[:]))
-def part1(moves: np.ndarray) -> int:
-    head, tail = 0, 0
-    tail_positions = {tail}
+        for k in range(1, n_knots):
+            dy = knots[k - 1, 0] - knots[k, 0]
+            dx = knots[k - 1, 1] - knots[k, 1]
+            if abs(dy) < 2 and abs(dx) < 2:
+                break  # this knot doesn't move, so none of the following do either
+            # move at most one step vertically and one step horizontally
+            knots[k, 0] += np.sign(dy)
+            knots[k, 1] += np.sign(dx)
 
-    for move in moves:
-        head += move
-        distance = head - tail
-        tail_move = _direction_vec(distance) if np.abs(distance) >= 2 else 0
-        tail += tail_move
-        tail_positions.add(tail)
+        visited[knots[-1, 0] - y0, knots[-1, 1] - x0] = True
 
-    return len(tail_positions)
 
+def _tail_positions(steps: np.ndarray, n_knots: int) -> int:
+    # no knot ever leaves the area covered by the head
+    head = np.concatenate([np.zeros((1, 2), np.int64), np.cumsum(steps, axis=0)])
+    (y0, x0), (y1, x1) = head.min(axis=0), head.max(axis=0)
 
-@njit(int64(complex128[:]))
-def part2(moves: np.ndarray) -> int:
-    knots = np.zeros(10, dtype=np.complex128)
-    tail_positions = {knots[-1]}
+    visited = OccupancyGrid.empty((y1 - y0 + 1, x1 - x0 + 1), origin=(y0, x0))
+    _pull_rope(steps, n_knots, visited.cells, y0, x0)
+    return visited.count()
 
-    for move in moves:
-        knots[0] += move
 
-        for i in range(1, len(knots)):
-            head, tail = knots[i - 1], knots[i]
-            distance = head - tail
-            tail_move = _direction_vec(distance) if np.abs(distance) >= 2 else 0
-            knots[i] += tail_move
+def part1(steps: np.ndarray) -> int:
+    return _tail_positions(steps, 2)
 
-        tail_positions.add(knots[-1])
 
-    return len(tail_positions)
+def part2(steps: np.ndarray) -> int:
+    return _tail_positions(steps, 10)
 
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 9).input_data)
+    return parse(load_input(9))
 
 
 @pytest.fixture()
@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
-from advent_of_code_ocr import convert_array_6
-from aocd.models import Puzzle
+
+from aoc.inputs import load_input
 
 
 def parse(data: str) -> list[int]:
@@ -22,6 +22,8 @@ def part1(add_ops: list[int]) -> int:
 
 
 def part2(add_ops: list[int]) -> str:
+    from advent_of_code_ocr import convert_array_6
+
     sprite_pos = np.cumsum([1] + add_ops)
     crt_pos = np.arange(len(sprite_pos)) % 40
     sprite_visible = (crt_pos >= sprite_pos - 1) & (crt_pos <= sprite_pos + 1)
@@ -31,7 +33,7 @@ def part2(add_ops: list[int]) -> str:
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 10).input_data)
+    return parse(load_input(10))
 
 
 def test_part1(puzzle_input):
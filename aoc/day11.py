@@ -1,11 +1,12 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Callable
 
 import numpy as np
 import pytest
-from aocd.models import Puzzle
 from parse import search
 
+from aoc.inputs import load_input
+
 _MONKEY_INPUT_FORMAT = """
 Monkey {monkey_id:d}:
   Starting items: {items}
@@ -51,7 +52,8 @@ class Monkey:
 
 class MonkeyGame:
     def __init__(self, monkeys: list[Monkey], worry_downscale: Callable[[int], int]):
-        self.monkeys = monkeys
+        # play with copies, the game modifies items and inspection counts
+        self.monkeys = [replace(monkey, items=list(monkey.items)) for monkey in monkeys]
         self.worry_downscale = worry_downscale
 
     def __repr__(self) -> str:
@@ -97,7 +99,7 @@ def part2(monkeys: list[Monkey]) -> int:
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 11).input_data)
+    return parse(load_input(11))
 
 
 @pytest.fixture()
@@ -149,3 +151,8 @@ def test_part2(puzzle_input):
 
 def test_example_part2(example_input):
     assert part2(example_input) == 2713310158
+
+
+def test_example_parts_share_input(example_input):
+    assert part1(example_input) == 10605
+    assert part2(example_input) == 2713310158
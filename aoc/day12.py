@@ -1,7 +1,7 @@
-import networkx as nx
 import numpy as np
 import pytest
-from aocd.models import Puzzle
+
+from aoc.inputs import load_input
 
 
 def _to_height(ch: str) -> int:
@@ -23,6 +23,8 @@ def parse(data: str) -> tuple[np.ndarray, tuple[int, int], tuple[int, int]]:
 
 
 def part1(heights: np.ndarray, start: tuple[int, int], end: tuple[int, int]) -> int:
+    import networkx as nx
+
     graph = nx.grid_2d_graph(*heights.shape).to_directed()
     edges = [
         (src, dst) for src, dst in graph.edges if (heights[src] + 1) >= heights[dst]
@@ -32,6 +34,8 @@ def part1(heights: np.ndarray, start: tuple[int, int], end: tuple[int, int]) ->
 
 
 def part2(heights: np.ndarray, _: tuple[int, int], end: tuple[int, int]) -> int:
+    import networkx as nx
+
     graph = nx.grid_2d_graph(*heights.shape).to_directed()
     # we will search from the target node in reverse to all starts -> reverse edges
     edges = [
@@ -45,7 +49,7 @@ def part2(heights: np.ndarray, _: tuple[int, int], end: tuple[int, int]) -> int:
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 12).input_data)
+    return parse(load_input(12))
 
 
 def test_part1(puzzle_input):
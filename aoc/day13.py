@@ -1,7 +1,8 @@
 from functools import cmp_to_key
 
 import pytest
-from aocd.models import Puzzle
+
+from aoc.inputs import load_input
 
 
 def parse(data: str):
@@ -53,7 +54,7 @@ def part2(packets) -> int:
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 13).input_data)
+    return parse(load_input(13))
 
 
 @pytest.fixture()
@@ -1,94 +1,99 @@
+import numpy as np
 import pytest
-from aocd.models import Puzzle
-from numba import complex128, int64, njit
-from numba.typed import Dict
 
+from aoc.grid import OccupancyGrid
+from aoc.inputs import load_input
+from aoc.jit import njit
 
-def parse(data: str) -> dict:
-    # use numba typed dict instead of {} to enable numba jit compilation speed up
-    grid = Dict.empty(key_type=complex128, value_type=int64)
+ROCK, SAND = 1, 2
+SOURCE = (0, 500)
+
+
+def parse(data: str) -> OccupancyGrid:
+    grid = OccupancyGrid.empty((1, 1), origin=SOURCE, dtype=np.uint8)
     for line in data.strip().splitlines():
         points = [tuple(map(int, p.split(","))) for p in line.split(" -> ")]
-        points = [y + x * 1j for x, y in points]
+        points = [(y, x) for x, y in points]
         for start, end in zip(points, points[1:]):
             add_rock_line(grid, start, end)
 
     return grid
 
 
-def add_rock_line(grid, start: complex, end: complex):
-    diff = end - start
-    if diff.real == 0:  # horizontal line
-        start_x, stop_x = sorted((start.imag, end.imag))
-        for x in range(int(start_x), int(stop_x) + 1):
-            grid[start.real + x * 1j] = 1
-    elif diff.imag == 0:  # vertical line
-        start_y, stop_y = sorted((start.real, end.real))
-        for y in range(int(start_y), int(stop_y) + 1):
-            grid[y + start.imag * 1j] = 1
-    else:
+def add_rock_line(grid: OccupancyGrid, start: tuple[int, int], end: tuple[int, int]):
+    (start_y, start_x), (end_y, end_x) = sorted((start, end))
+    if start_y != end_y and start_x != end_x:
         raise ValueError("points not on the same line")
 
+    grid[start_y, start_x] = ROCK
+    grid[end_y, end_x] = ROCK
+    (y0, x0), (y1, x1) = grid.index(start_y, start_x), grid.index(end_y, end_x)
+    grid.cells[y0 : y1 + 1, x0 : x1 + 1] = ROCK
 
-@njit
-def sand_fill(grid: dict, floor: bool = False) -> int:
+
+@njit("int64(uint8[:, :], int64, int64, int64, boolean)")
+def sand_fill(cave: np.ndarray, y: int, x: int, max_y: int, floor: bool) -> int:
     n = 0
-    while spawn_sand(grid, floor):
+    while spawn_sand(cave, y, x, max_y, floor):
         n += 1
     return n
 
 
-@njit
-def spawn_sand(grid: dict, floor: bool = False) -> bool:
+@njit("boolean(uint8[:, :], int64, int64, int64, boolean)")
+def spawn_sand(cave: np.ndarray, y: int, x: int, max_y: int, floor: bool) -> bool:
     """
-    Spawn a new sand element and let it trickle down
+    Spawn a new sand element at cave[y, x] and let it trickle down
 
-    Returns True if the sand stopped, and False if it fell out of bounds or
+    Returns True if the sand stopped, and False if it fell below max_y or
     stopped if the spawn point is already blocked by sand
     """
-    sand = 500j
-    if sand in grid:  # stop if we have reached all the way to the top
+    if cave[y, x]:  # stop if we have reached all the way to the top
         return False
 
-    max_y = _max_y(grid)
-    while sand.real <= max_y:
-        moved = sand_move(grid, sand)
-        if moved == sand:  # no move, come to a rest
-            grid[sand] = 2
+    while y <= max_y:
+        moved_x = sand_move(cave, y, x)
+        if moved_x < 0:  # no move, come to a rest
+            cave[y, x] = SAND
             return True
-        sand = moved
+        y, x = y + 1, moved_x
 
     if floor:
-        grid[sand] = 2
+        cave[y, x] = SAND
     return floor  # if we have a floor continue on, otherwise stop (part 1)
 
 
-@njit
-def _max_y(grid: dict) -> int:
-    """Maximum y coordinate of a rock in the grid"""
-    return int(max([k.real for k, v in grid.items() if v == 1]))
+@njit("int64(uint8[:, :], int64, int64)")
+def sand_move(cave: np.ndarray, y: int, x: int) -> int:
+    """Column the sand moves to when falling by one step, or -1 if it can't move"""
+    for dx in (0, -1, 1):
+        if cave[y + 1, x + dx] == 0:  # still empty
+            return x + dx
+    return -1
+
 
+def _sand_fill(grid: OccupancyGrid, floor: bool) -> int:
+    # sand comes to a rest on the floor at max_y + 1 at the latest, and never moves
+    # further sideways than down. Grow a copy of the grid to hold all of it
+    max_y = grid.bounds()[1]
+    cave = grid.copy()
+    cave.grow_to_include(max_y + 1, SOURCE[1] - max_y - 2)
+    cave.grow_to_include(max_y + 1, SOURCE[1] + max_y + 2)
 
-@njit
-def sand_move(grid: dict, sand: complex) -> complex:
-    """Move sand by one step if possible"""
-    for direction in [(1 + 0j), (1 - 1j), (1 + 1j)]:
-        if sand + direction not in grid:  # still empty
-            return sand + direction
-    return sand  # no move possible
+    y, x = cave.index(*SOURCE)
+    return sand_fill(cave.cells, y, x, cave.index(max_y, 0)[0], floor)
 
 
-def part1(grid: dict) -> int:
-    return sand_fill(grid, floor=False)
+def part1(grid: OccupancyGrid) -> int:
+    return _sand_fill(grid, floor=False)
 
 
-def part2(grid: dict) -> int:
-    return sand_fill(grid, floor=True)
+def part2(grid: OccupancyGrid) -> int:
+    return _sand_fill(grid, floor=True)
 
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 14).input_data)
+    return parse(load_input(14))
 
 
 @pytest.fixture()
@@ -115,3 +120,8 @@ def test_part2(puzzle_input):
 
 def test_example_part2(example_input):
     assert part2(example_input) == 93
+
+
+def test_example_parts_share_input(example_input):
+    assert part1(example_input) == 24
+    assert part2(example_input) == 93
@@ -1,10 +1,15 @@
 # thanks shapely for doing all the heavy lifting for this puzzle :)
+from __future__ import annotations
+
 import re
+from typing import TYPE_CHECKING
 
 import pytest
-from aocd.models import Puzzle
-from shapely.geometry import LineString, Polygon
-from shapely.ops import unary_union
+
+from aoc.inputs import load_input
+
+if TYPE_CHECKING:
+    from shapely.geometry import Polygon
 
 INPUT_PATTERN = re.compile(
     r"Sensor at x=([-\d]+), y=([-\d]+): closest beacon is at x=([-\d]+), y=([-\d]+)"
@@ -13,6 +18,8 @@ INPUT_PATTERN = re.compile(
 
 def parse(data: str) -> list[Polygon]:
     """Parse sensor coverage areas as shapely polygons"""
+    from shapely.geometry import Polygon
+
     polys = []
     for line in data.strip().splitlines():
         x, y, beacon_x, beacon_y = map(int, re.match(INPUT_PATTERN, line).groups())
@@ -22,6 +29,9 @@ def parse(data: str) -> list[Polygon]:
 
 
 def part1(sensors: list[Polygon], row: int) -> int:
+    from shapely.geometry import LineString
+    from shapely.ops import unary_union
+
     # unary_union: intersection of all individual polygons as a single polygon
     sensor_coverage = unary_union(sensors)
     min_x, _, max_x, _ = sensor_coverage.bounds
@@ -33,6 +43,8 @@ def part1(sensors: list[Polygon], row: int) -> int:
 
 
 def part2(sensors: list[Polygon]) -> int:
+    from shapely.ops import unary_union
+
     # with shapely this becomes stupidly easy:
     sensor_coverage = unary_union(sensors)
     # now there is one hole, whose center we can get very easily:
@@ -42,7 +54,7 @@ def part2(sensors: list[Polygon]) -> int:
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 15).input_data)
+    return parse(load_input(15))
 
 
 @pytest.fixture()
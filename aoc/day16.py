@@ -1,9 +1,15 @@
+from __future__ import annotations
+
 import re
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
-import networkx as nx
 import pytest
-from aocd.models import Puzzle
+
+from aoc.inputs import load_input
+
+if TYPE_CHECKING:
+    import networkx as nx
 
 INPUT_PATTERN = re.compile(
     r"Valve ([A-Z]+) has flow rate=(\d+); tunnels? leads? to valves? ([A-Z, ]+)"
@@ -11,6 +17,8 @@ INPUT_PATTERN = re.compile(
 
 
 def parse(data: str) -> nx.Graph:
+    import networkx as nx
+
     graph = nx.Graph()
     parsed = [
         tuple(INPUT_PATTERN.match(line).groups()) for line in data.strip().splitlines()
@@ -58,6 +66,8 @@ class Volcano:
 
 
 def part1(graph: nx.Graph) -> int:
+    import networkx as nx
+
     distances = nx.floyd_warshall_numpy(graph).astype(int)
     flow_rates = tuple([graph.nodes[n]["flow_rate"] for n in graph])
     start_node = list(graph).index("AA")
@@ -108,6 +118,8 @@ def exhaustive_search(volcano, valve, closed_valves, remaining_time, elephant: b
 
 
 def part2(graph: nx.Graph) -> int:
+    import networkx as nx
+
     distances = nx.floyd_warshall_numpy(graph).astype(int)
     flow_rates = tuple([graph.nodes[n]["flow_rate"] for n in graph])
     start_node = list(graph).index("AA")
@@ -119,7 +131,7 @@ def part2(graph: nx.Graph) -> int:
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 16).input_data)
+    return parse(load_input(16))
 
 
 @pytest.fixture()
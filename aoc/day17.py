@@ -1,105 +1,102 @@
-from itertools import cycle
-from typing import Iterable
-
 import numpy as np
 import pytest
-from aocd.models import Puzzle
-
-ROCKS = [
-    {0 + 0j, 0 + 1j, 0 + 2j, 0 + 3j},  # ----
-    {2 + 1j, 1 + 0j, 1 + 1j, 1 + 2j, 0 + 1j},  # +
-    {2 + 2j, 1 + 2j, 0 + 0j, 0 + 1j, 0 + 2j},  # _|
-    {3 + 0j, 2 + 0j, 1 + 0j, 0 + 0j},  # |
-    {1 + 0j, 1 + 1j, 0 + 0j, 0 + 1j},  # square
-]
-
-DIRECTIONS = {
-    "<": 0 - 1j,
-    ">": 0 + 1j,
-}
-DOWN = -1 + 0j
-
-SPAWN_POSITION = 3 + 2j
+
+from aoc.grid import OccupancyGrid
+from aoc.inputs import load_input
+from aoc.jit import njit
+
+# cells of each rock as (y, x) offsets to its bottom left corner, with y pointing up.
+# Rocks with only four cells repeat one of them, so that they fit into one array
+ROCKS = np.array(
+    [
+        [(0, 0), (0, 1), (0, 2), (0, 3), (0, 3)],  # ----
+        [(2, 1), (1, 0), (1, 1), (1, 2), (0, 1)],  # +
+        [(2, 2), (1, 2), (0, 0), (0, 1), (0, 2)],  # _|
+        [(3, 0), (2, 0), (1, 0), (0, 0), (0, 0)],  # |
+        [(1, 0), (1, 1), (0, 0), (0, 1), (0, 1)],  # square
+    ],
+    dtype=np.int64,
+)
+ROCK_HEIGHT = 4
+
+DIRECTIONS = {"<": -1, ">": 1}
+
+SPAWN_POSITION = (3, 2)
 CHAMBER_WIDTH = 7
 
 
-def parse(data: str) -> list[complex]:
-    return list(map(DIRECTIONS.__getitem__, data.strip()))
+def parse(data: str) -> np.ndarray:
+    return np.array([DIRECTIONS[c] for c in data.strip()], dtype=np.int64)
 
 
-def iterate_n_times(iterable: Iterable, n: int):
-    for val, _ in zip(cycle(iterable), range(n)):
-        yield val
+@njit("boolean(boolean[:, :], int64[:, :], int64, int64)")
+def _fits(chamber: np.ndarray, rock: np.ndarray, y: int, x: int) -> bool:
+    """Check whether the rock at (y, x) is inside the chamber and hits no other rock"""
+    for i in range(len(rock)):
+        cell_y, cell_x = y + rock[i, 0], x + rock[i, 1]
+        if cell_y < 0 or cell_x < 0 or cell_x >= chamber.shape[1]:
+            return False
+        if chamber[cell_y, cell_x]:
+            return False
+    return True
 
 
-def move(rock: set[complex], direction: complex):
-    return {c + direction for c in rock}
+@njit("int64[:](int64[:], int64[:, :, :], int64, boolean[:, :])")
+def _drop_rocks(
+    directions: np.ndarray, rocks: np.ndarray, n_rocks: int, chamber: np.ndarray
+) -> np.ndarray:
+    """Drop n_rocks rocks, returning the height of the tower after each of them"""
+    heights = np.empty(n_rocks, dtype=np.int64)
+    tower_height = 0  # no rock exists yet
+    jet = 0
 
+    for i in range(n_rocks):
+        rock = rocks[i % len(rocks)]
+        y, x = tower_height + SPAWN_POSITION[0], SPAWN_POSITION[1]
 
-def _fits_in_chamber(rock: set[complex], chamber_width: int = CHAMBER_WIDTH):
-    """
-    Check whether the given rock fits in the chamber: True if it fits, false otherwise
-    """
-    return all(c.imag >= 0 and c.imag < chamber_width for c in rock)
+        while True:  # simulate rocks
+            # move rock left/right if possible
+            direction = directions[jet]
+            jet = (jet + 1) % len(directions)
+            if _fits(chamber, rock, y, x + direction):
+                x += direction
 
+            if not _fits(chamber, rock, y - 1, x):
+                break
+            y -= 1
 
-def _collision(rock: set[complex], rocks: set[complex]):
-    return any(c.real < 0 for c in rock) or len(rock & rocks) >= 1
+        # current rock is at its final position, add it to the chamber
+        for c in range(len(rock)):
+            chamber[y + rock[c, 0], x + rock[c, 1]] = True
+            tower_height = max(tower_height, y + rock[c, 0] + 1)
+        heights[i] = tower_height
 
+    return heights
 
-def _visualize(rocks: set[complex]):
+
+def _visualize(chamber: OccupancyGrid):
     """
     Helper function to pretty print the game state to the console
     """
-    max_y = int(max(c.real for c in rocks))
-
-    result = ""
-    for y in range(max_y + 1, -1, -1):
-        result += "|"
-        for x in range(CHAMBER_WIDTH):
-            result += "#" if (y + x * 1j) in rocks else "."
-        result += "|\n"
+    tower_height = chamber.bounds()[1] + 1
+    top_down = OccupancyGrid(chamber.cells[tower_height::-1])
+    rows = [f"|{row}|" for row in top_down.render().splitlines()]
+    print("\n".join(rows) + "\n+" + ("-" * CHAMBER_WIDTH) + "+")
 
-    result += "+" + ("-" * CHAMBER_WIDTH) + "+"
-    print(result)
 
-
-def _play_tetris(directions, n_rocks: int, debug: bool = False) -> list[int]:
-    rocks = set()
-    tower_height = 0  # no rock exists yet
-    heights = []
-    directions = cycle(directions)
-
-    for rock in iterate_n_times(ROCKS, n_rocks):
-        rock = move(rock, tower_height + SPAWN_POSITION)
-        if debug:
-            _visualize(rocks | rock)
-            print()
-
-        while True:  # simulate rocks
-            # move rock left/right if possible
-            rock_moved = move(rock, next(directions))
-            if _fits_in_chamber(rock_moved) and not _collision(rock_moved, rocks):
-                rock = rock_moved
-
-            rock_down = move(rock, DOWN)
-            if _collision(rock_down, rocks):
-                break
-            rock = rock_down
-
-        # current rock is at its final position, add it to the set of rocks
-        rocks = rocks | rock
-        tower_height = max([tower_height] + [(c.real + 1) for c in rock])
-        heights.append(int(tower_height))
-
-    return heights
+def _play_tetris(directions: np.ndarray, n_rocks: int) -> np.ndarray:
+    # the y axis of the chamber points up. Every rock adds at most ROCK_HEIGHT rows
+    # to the tower, and it spawns SPAWN_POSITION rows above its top
+    rows = n_rocks * ROCK_HEIGHT + SPAWN_POSITION[0]
+    chamber = OccupancyGrid.empty((rows, CHAMBER_WIDTH))
+    return _drop_rocks(directions, ROCKS, n_rocks, chamber.cells)
 
 
-def part1(directions: list[complex]) -> int:
-    return _play_tetris(directions, 2022)[-1]
+def part1(directions: np.ndarray) -> int:
+    return int(_play_tetris(directions, 2022)[-1])
 
 
-def part2(directions: list[complex]) -> int:
+def part2(directions: np.ndarray) -> int:
     # we need to find a repeating pattern in the tower heights
     heights = _play_tetris(directions, 20000)
     # lets look at the differences in height after each block
@@ -124,7 +121,7 @@ def part2(directions: list[complex]) -> int:
     remaining_blocks = remaining_blocks % pattern_length
     tower_height += heights[pattern_start + remaining_blocks] - heights[pattern_start]
 
-    return tower_height
+    return int(tower_height)
 
 
 def find_repeating_pattern(
@@ -149,7 +146,7 @@ def find_repeating_pattern(
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 17).input_data)
+    return parse(load_input(17))
 
 
 @pytest.fixture()
@@ -3,7 +3,8 @@ from itertools import combinations
 
 import numpy as np
 import pytest
-from aocd.models import Puzzle
+
+from aoc.inputs import load_input
 
 # simple enough :D
 sys.setrecursionlimit(10000)
@@ -27,7 +28,7 @@ def part1(cubes: list[tuple[int, int, int]]) -> int:
 
 
 def part2(cubes: list[tuple[int, int, int]]) -> int:
-    cubes -= cubes.min(axis=0)  # start with lowest index
+    cubes = cubes - cubes.min(axis=0)  # start with lowest index
     space = np.zeros(shape=(np.max(cubes, axis=0) + 1), dtype=int)
     for x, y, z in cubes:
         space[x, y, z] = 1
@@ -64,7 +65,7 @@ def _flood_fill(space: np.ndarray, x: int, y: int, z: int):
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 18).input_data)
+    return parse(load_input(18))
 
 
 @pytest.fixture()
@@ -102,3 +103,9 @@ def test_part2(puzzle_input):
 
 def test_example_part2(example_input):
     assert part2(example_input) == 58
+
+
+def test_example_parts_share_input(example_input):
+    assert part2(example_input) == 58
+    assert part2(example_input) == 58
+    assert part1(example_input) == 64
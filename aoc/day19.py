@@ -4,7 +4,8 @@ from functools import cached_property, lru_cache
 from math import ceil, inf
 
 import pytest
-from aocd.models import Puzzle
+
+from aoc.inputs import load_input
 
 
 @dataclass
@@ -257,7 +258,7 @@ def part2(blueprints: list[Blueprint]) -> int:
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 19).input_data)
+    return parse(load_input(19))
 
 
 @pytest.fixture()
@@ -1,6 +1,7 @@
 import numpy as np
 import pytest
-from aocd.models import Puzzle
+
+from aoc.inputs import load_input
 
 DECRYPTION_KEY = 811589153
 
@@ -37,13 +38,13 @@ def part1(values: np.ndarray, n: int = 1) -> int:
 
 
 def part2(values: np.ndarray) -> int:
-    values *= DECRYPTION_KEY
+    values = values * DECRYPTION_KEY
     return part1(values, n=10)
 
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 20).input_data)
+    return parse(load_input(20))
 
 
 @pytest.fixture()
@@ -75,3 +76,8 @@ def test_part2(puzzle_input):
 
 def test_example_part2(example_input):
     assert part2(example_input) == 1623178306
+
+
+def test_example_parts_share_input(example_input):
+    assert part2(example_input) == 1623178306
+    assert part1(example_input) == 3
@@ -2,7 +2,8 @@ from functools import partial
 from typing import Callable
 
 import pytest
-from aocd.models import Puzzle
+
+from aoc.inputs import load_input
 
 
 def parse(data: str) -> dict[str, int | tuple[str, str, str]]:
@@ -46,8 +47,10 @@ def part1(monkeys: dict[str, int | tuple[str, str, str]]) -> int:
 
 
 def part2(equations: dict[str, int | tuple[str, str, str]]) -> int:
-    equations.pop("humn")  # so it will raise a key error when looking for it
-    monkey_funcs = _construct_top_down_solving_functions(equations)
+    # leave out humn, so it will raise a key error when looking for it
+    monkey_funcs = _construct_top_down_solving_functions(
+        {name: expr for name, expr in equations.items() if name != "humn"}
+    )
     return _solve(equations, monkey_funcs, "root", 0)
 
 
@@ -55,7 +58,7 @@ def _solve(monkeys: dict, functions: dict, name: str, value: int = None):
     if name == "humn":
         return value
 
-    left, op, right = monkeys.pop(name)
+    left, op, right = monkeys[name]
     if name == "root":
         op = "="
 
@@ -103,7 +106,7 @@ def _solve(monkeys: dict, functions: dict, name: str, value: int = None):
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 21).input_data)
+    return parse(load_input(21))
 
 
 @pytest.fixture()
@@ -143,3 +146,9 @@ def test_part2(puzzle_input):
 
 def test_example_part2(example_input):
     assert part2(example_input) == 301
+
+
+def test_example_parts_share_input(example_input):
+    assert part2(example_input) == 301
+    assert part1(example_input) == 152
+    assert part2(example_input) == 301
@@ -2,14 +2,12 @@ import re
 
 import numpy as np
 import pytest
-from aocd.models import Puzzle
 
-RIGHT = 0 + 1j
-DOWN = 1 + 0j
-LEFT = 0 - 1j
-UP = -1 + 0j
+from aoc.grid import DOWN, LEFT, RIGHT, UP
+from aoc.inputs import load_input
+
 FACINGS = [RIGHT, DOWN, LEFT, UP]
-TURNS = {"L": 1j, "R": -1j}
+TURNS = {"L": -1, "R": 1}  # steps through the facings, which are in clockwise order
 
 
 def parse(data: str) -> tuple[np.ndarray, list[tuple[int, str]]]:
@@ -29,7 +27,7 @@ def parse(data: str) -> tuple[np.ndarray, list[tuple[int, str]]]:
 class WrappedBoard2D:
     def __init__(self, board: np.ndarray) -> None:
         self.board = board
-        self.pos = 0 + 50j  # hardcoded for real input
+        self.pos = (0, 50)  # hardcoded for real input
         self.facing = RIGHT
 
     def walk(self, path: list[tuple[int, str]]):
@@ -41,7 +39,7 @@ class WrappedBoard2D:
         self.turn("R")  # reverse the very last left turn we appended
 
     def turn(self, direction: str):
-        self.facing = self.facing * TURNS[direction]
+        self.facing = FACINGS[(FACINGS.index(self.facing) + TURNS[direction]) % 4]
 
     def step(self):
         next_pos, next_facing = self._wrap(self.pos, self.facing)
@@ -50,32 +48,34 @@ class WrappedBoard2D:
             self.facing = next_facing
 
     def _wrap(self, pos, facing):
-        pos = pos + facing
+        pos = (pos[0] + facing[0], pos[1] + facing[1])
         if facing in (LEFT, RIGHT):
             return self._wrap_left_right(pos, facing)
         return self._wrap_up_down(pos, facing)
 
     def _wrap_left_right(self, pos, facing):
-        if 0 <= pos.real < 50:
-            return pos.real + ((int(pos.imag - 50) % 100) + 50) * 1j, facing
-        if pos.real < 100:
-            return pos.real + ((int(pos.imag - 50) % 50) + 50) * 1j, facing
-        if pos.real < 150:
-            return pos.real + (int(pos.imag) % 100) * 1j, facing
+        y, x = pos
+        if 0 <= y < 50:
+            return (y, (x - 50) % 100 + 50), facing
+        if y < 100:
+            return (y, (x - 50) % 50 + 50), facing
+        if y < 150:
+            return (y, x % 100), facing
 
-        return pos.real + (int(pos.imag) % 50) * 1j, facing
+        return (y, x % 50), facing
 
     def _wrap_up_down(self, pos, facing):
-        if 0 <= pos.imag < 50:
-            return ((int(pos.real - 100) % 100) + 100) + pos.imag * 1j, facing
-        if pos.imag < 100:
-            return (int(pos.real) % 150) + pos.imag * 1j, facing
+        y, x = pos
+        if 0 <= x < 50:
+            return ((y - 100) % 100 + 100, x), facing
+        if x < 100:
+            return (y % 150, x), facing
 
-        return (int(pos.real) % 50) + pos.imag * 1j, facing
+        return (y % 50, x), facing
 
-    def is_empty(self, pos: complex):
+    def is_empty(self, pos: tuple[int, int]):
         try:
-            val = self.board[int(pos.real), int(pos.imag)]
+            val = self.board[pos]
             assert val >= 0  # never end up in no mans land
             return val == 0
         except IndexError:
@@ -83,11 +83,8 @@ class WrappedBoard2D:
             raise
 
     def password(self):
-        return int(
-            1000 * (self.pos.real + 1)
-            + 4 * (self.pos.imag + 1)
-            + FACINGS.index(self.facing)
-        )
+        y, x = self.pos
+        return 1000 * (y + 1) + 4 * (x + 1) + FACINGS.index(self.facing)
 
 
 def part1(arr: np.ndarray, path: list[tuple[int, str]]) -> int:
@@ -112,17 +109,17 @@ def part1(arr: np.ndarray, path: list[tuple[int, str]]) -> int:
 
 class WrappedBoard3D(WrappedBoard2D):
     def _wrap(self, pos, facing):
-        pos = pos + facing
+        y, x = pos[0] + facing[0], pos[1] + facing[1]
         if facing == UP:
-            y, x, facing = self._wrap_up(pos.real, pos.imag, facing)
+            y, x, facing = self._wrap_up(y, x, facing)
         elif facing == DOWN:
-            y, x, facing = self._wrap_down(pos.real, pos.imag, facing)
+            y, x, facing = self._wrap_down(y, x, facing)
         elif facing == RIGHT:
-            y, x, facing = self._wrap_right(pos.real, pos.imag, facing)
+            y, x, facing = self._wrap_right(y, x, facing)
         elif facing == LEFT:
-            y, x, facing = self._wrap_left(pos.real, pos.imag, facing)
+            y, x, facing = self._wrap_left(y, x, facing)
 
-        return y + x * 1j, facing
+        return (y, x), facing
 
     def _wrap_up(self, y, x, facing):
         """Wrap along the 3 up facing edges (A, B, D)"""
@@ -177,7 +174,7 @@ def part2(arr: np.ndarray, path: list[tuple[int, str]]) -> int:
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 22).input_data)
+    return parse(load_input(22))
 
 
 def test_part1(puzzle_input):
@@ -1,36 +1,32 @@
-from collections import defaultdict
 from itertools import count, cycle
 from typing import Optional
 
+import numpy as np
 import pytest
-from aocd.models import Puzzle
+
+from aoc.grid import NEIGHBOURS_8, OccupancyGrid, shift
+from aoc.inputs import load_input
 
 DIRECTIONS = [
-    (-1 - 1j, -1 + 0j, -1 + 1j),  # north
-    (1 - 1j, 1 + 0j, 1 + 1j),  # south
-    (-1 - 1j, 0 - 1j, 1 - 1j),  # west
-    (-1 + 1j, 0 + 1j, 1 + 1j),  # east
+    ((-1, -1), (-1, 0), (-1, 1)),  # north
+    ((1, -1), (1, 0), (1, 1)),  # south
+    ((-1, -1), (0, -1), (1, -1)),  # west
+    ((-1, 1), (0, 1), (1, 1)),  # east
 ]
 
-NEIGHBOURS_8 = {y + x * 1j for y in range(-1, 2) for x in range(-1, 2)} - {0}
-
 
-def parse(data: str) -> set[complex]:
-    lines = data.strip().splitlines()
+def parse(data: str) -> OccupancyGrid:
+    return OccupancyGrid.from_lines(data.strip().splitlines())
 
-    return {
-        y + x * 1j
-        for y, line in enumerate(lines)
-        for x, ch in enumerate(line)
-        if ch == "#"
-    }
 
-
-def _simulate(elves: set[complex], n: Optional[int] = None):
+def _simulate(elves: OccupancyGrid, n: Optional[int] = None):
+    elves = elves.copy()
     rounds = range(n) if n else count()
     for i, first_direction in zip(rounds, cycle(range(4))):
-        elves, no_moves = _round(
-            elves, DIRECTIONS[first_direction:] + DIRECTIONS[:first_direction]
+        # elves move at most one cell per round, keep an empty border around them
+        elves.ensure_margin(1)
+        elves.cells, no_moves = _round(
+            elves.cells, DIRECTIONS[first_direction:] + DIRECTIONS[:first_direction]
         )
         if no_moves:
             return elves, i + 1
@@ -38,54 +34,54 @@ def _simulate(elves: set[complex], n: Optional[int] = None):
     return elves, i + 1
 
 
-def _round(elves: set[complex], directions: list[tuple[complex, complex, complex]]):
+def _round(elves: np.ndarray, directions: list[tuple[tuple[int, int], ...]]):
+    """
+    Simulate one round for all elves at once, on an array without elves on its edges
+    """
+
+    def neighbour(dy: int, dx: int) -> np.ndarray:
+        """Which cells have an elf at the cell (dy, dx) next to them"""
+        return shift(elves, -dy, -dx)
+
     # First half of the round:
-    proposed = defaultdict(list)
-    for elf in elves:
-        if not any((elf + n) in elves for n in NEIGHBOURS_8):
-            continue
-        for dirs in directions:
-            if not any((elf + d) in elves for d in dirs):
-                proposed[elf + dirs[1]].append(elf)
-                break
+    undecided = elves & np.logical_or.reduce([neighbour(*n) for n in NEIGHBOURS_8])
+    proposals = []
+    for dirs in directions:
+        proposing = undecided & ~np.logical_or.reduce([neighbour(*d) for d in dirs])
+        undecided &= ~proposing
+        proposals.append((dirs[1], proposing))
 
     # Second half:
-    moved_elfes = {v[0] for v in proposed.values() if len(v) == 1}
-    new_positions = {k for k, v in proposed.items() if len(v) == 1}
-    return (elves - moved_elfes) | new_positions, len(moved_elfes) == 0
-
-
-def _visualize(elves):
-    y0, y1, x0, x1 = _bounds(elves)
-    out = ""
-    for y in range(y0, y1 + 1):
-        for x in range(x0, x1 + 1):
-            out += "#" if (y + x * 1j) in elves else "."
-        out += "\n"
-    print(out)
-    print("----\n\n")
+    n_proposed = sum(shift(p.astype(np.int8), *d) for d, p in proposals)
+    moved = np.zeros_like(elves)
+    new_positions = np.zeros_like(elves)
+    for (dy, dx), proposing in proposals:
+        accepted = proposing & shift(n_proposed == 1, -dy, -dx)
+        moved |= accepted
+        new_positions |= shift(accepted, dy, dx)
 
+    return (elves & ~moved) | new_positions, not moved.any()
 
-def _bounds(elves: set[complex]):
-    ys = [int(elf.real) for elf in elves]
-    xs = [int(elf.imag) for elf in elves]
-    return min(ys), max(ys), min(xs), max(xs)
+
+def _visualize(elves: OccupancyGrid):
+    print(elves.render())
+    print("----\n\n")
 
 
-def part1(elves: set[complex]) -> int:
+def part1(elves: OccupancyGrid) -> int:
     elves, _ = _simulate(elves, 10)
-    y0, y1, x0, x1 = _bounds(elves)
-    return (y1 - y0 + 1) * (x1 - x0 + 1) - len(elves)
+    y0, y1, x0, x1 = elves.bounds()
+    return (y1 - y0 + 1) * (x1 - x0 + 1) - elves.count()
 
 
-def part2(elves: set[complex]) -> int:
+def part2(elves: OccupancyGrid) -> int:
     _, n = _simulate(elves)
     return n
 
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 23).input_data)
+    return parse(load_input(23))
 
 
 @pytest.fixture()
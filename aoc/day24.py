@@ -1,14 +1,8 @@
 import numpy as np
 import pytest
-from aocd.models import Puzzle
-from tqdm import tqdm
 
-MOVES = [0 + 0j, -1 + 0j, 1 + 0j, 0 + 1j, 0 - 1j]
-
-
-def _coords_of(blizzard_map, symbol):
-    indices = np.where(blizzard_map == symbol)
-    return set(indices[0] + indices[1] * 1j)
+from aoc.grid import NEIGHBOURS_4, OccupancyGrid, shift
+from aoc.inputs import load_input
 
 
 class Blizzards:
@@ -17,85 +11,64 @@ class Blizzards:
         self.height = blizzard_map.shape[0] - 4
         self.width = blizzard_map.shape[1] - 2
 
-        right_moving = _coords_of(blizzard_map, ">")
-        left_moving = _coords_of(blizzard_map, "<")
-        up_moving = _coords_of(blizzard_map, "^")
-        down_moving = _coords_of(blizzard_map, "v")
-        self._blizzards = (right_moving, left_moving, up_moving, down_moving)
-
-    @property
-    def blizzards(self):
-        return set.union(*self._blizzards)
+        self.walls = OccupancyGrid(blizzard_map == "#")
+        # the valley inside of the walls, which the blizzards never leave
+        valley = blizzard_map[2:-2, 1:-1]
+        self._blizzards = tuple(valley == symbol for symbol in (">", "<", "^", "v"))
 
-    def is_wall(self, coord):
-        return self.blizzard_map[int(coord.real), int(coord.imag)] == "#"
-
-    def step(self):
+    def blocked(self, time: int) -> np.ndarray:
+        """All cells which are either a wall or have a blizzard at the given time"""
         right_moving, left_moving, up_moving, down_moving = self._blizzards
-
-        right_moving = {
-            b.real + ((b.imag - 1 + 1) % self.width + 1) * 1j for b in right_moving
-        }
-        left_moving = {
-            b.real + ((b.imag - 1 - 1) % self.width + 1) * 1j for b in left_moving
-        }
-        up_moving = {
-            ((b.real - 2 - 1) % self.height + 2) + b.imag * 1j for b in up_moving
-        }
-        down_moving = {
-            ((b.real - 2 + 1) % self.height + 2) + b.imag * 1j for b in down_moving
-        }
-
-        self._blizzards = (right_moving, left_moving, up_moving, down_moving)
-        return self.blizzards
+        blocked = self.walls.cells.copy()
+        blocked[2:-2, 1:-1] |= (
+            np.roll(right_moving, time, axis=1)
+            | np.roll(left_moving, -time, axis=1)
+            | np.roll(up_moving, -time, axis=0)
+            | np.roll(down_moving, time, axis=0)
+        )
+        return blocked
 
 
-def parse(data: str) -> list[str]:
+def parse(data: str) -> Blizzards:
     blizzard_map = np.asarray([list(line) for line in data.strip().splitlines()])
     # pad with walls on the top and bottom:
     blizzard_map = np.pad(blizzard_map, ((1, 1), (0, 0)), constant_values="#")
     return Blizzards(blizzard_map)
 
 
-def _walk(blizzards, start, stop):
-    time = 0
-    positions = {start}
-    with tqdm(total=1000) as pbar:
-        while stop not in positions:
-            next_positions = set()
-            coords = blizzards.step()
-            for pos in positions:
-                for move in MOVES:
-                    next_pos = pos + move
-                    if next_pos not in coords and not blizzards.is_wall(next_pos):
-                        next_positions.add(next_pos)
-
-            positions = next_positions
-            time += 1
-            pbar.update(1)
+def _walk(blizzards: Blizzards, start, stop, time: int = 0) -> int:
+    """Walk from start to stop, starting at the given time and returning the arrival"""
+    positions = OccupancyGrid.empty(blizzards.blizzard_map.shape)
+    positions[start] = True
+    reachable = positions.cells
+    while not reachable[stop]:
+        time += 1
+        # wait or move to any neighbour, as long as it is free in the next minute
+        reachable = np.logical_or.reduce(
+            [reachable] + [shift(reachable, *move) for move in NEIGHBOURS_4]
+        )
+        reachable &= ~blizzards.blocked(time)
 
     return time
 
 
 def part1(blizzards: Blizzards) -> int:
-    start = 1 + 1j
-    stop = blizzards.height + 2 + blizzards.width * 1j
+    start = (1, 1)
+    stop = (blizzards.height + 2, blizzards.width)
     return _walk(blizzards, start, stop)
 
 
 def part2(blizzards: Blizzards) -> int:
-    start = 1 + 1j
-    stop = blizzards.height + 2 + blizzards.width * 1j
-    return (
-        _walk(blizzards, start, stop)
-        + _walk(blizzards, stop, start)
-        + _walk(blizzards, start, stop)
-    )
+    start = (1, 1)
+    stop = (blizzards.height + 2, blizzards.width)
+    time = _walk(blizzards, start, stop)
+    time = _walk(blizzards, stop, start, time)
+    return _walk(blizzards, start, stop, time)
 
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 24).input_data)
+    return parse(load_input(24))
 
 
 @pytest.fixture()
@@ -128,5 +101,10 @@ def test_example_part2(example_input):
     assert part2(example_input) == 54
 
 
+def test_example_parts_share_input(example_input):
+    assert part1(example_input) == 18
+    assert part2(example_input) == 54
+
+
 if __name__ == "__main__":
-    print(part2(parse(Puzzle(2022, 24).input_data)))
+    print(part2(parse(load_input(24))))
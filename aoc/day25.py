@@ -1,5 +1,6 @@
 import pytest
-from aocd.models import Puzzle
+
+from aoc.inputs import load_input
 
 _SNAFU_DIGITS = {"2": 2, "1": 1, "0": 0, "-": -1, "=": -2}
 _SNAFU_BASE = len(_SNAFU_DIGITS)
@@ -35,7 +36,7 @@ def part1(snafu_numbers: list[str]) -> str:
 
 @pytest.fixture()
 def puzzle_input():
-    return parse(Puzzle(2022, 25).input_data)
+    return parse(load_input(25))
 
 
 @pytest.fixture()
@@ -0,0 +1,548 @@
+"""
+Deterministic, synthetic puzzle inputs of arbitrary size
+
+A scale of 1 produces inputs roughly as large as the real puzzle inputs, a scale of
+1000 inputs about a thousand times as large. The same seed always produces the same
+input. Inputs can be written to the local input store under a name, so that all
+fixtures (via AOC_INPUT) or the runner (via --input) pick them up:
+
+    python -m aoc.generators 17 20 --scale 1000 --name x1000
+"""
+import argparse
+import math
+import random
+import string
+from typing import Callable
+
+import pytest
+
+from aoc.inputs import register_input
+from aoc.runner import call_part, load_day, parse_function, parts
+
+
+def _n(base: float, scale: float, minimum: int = 1) -> int:
+    return max(minimum, round(base * scale))
+
+
+def _day01(rng: random.Random, scale: float) -> str:
+    elves = [
+        "\n".join(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15)))
+        for _ in range(_n(250, scale))
+    ]
+    return "\n\n".join(elves)
+
+
+def _day02(rng: random.Random, scale: float) -> str:
+    return "\n".join(
+        f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(_n(2500, scale))
+    )
+
+
+def _day03(rng: random.Random, scale: float) -> str:
+    """
+    Groups of three rucksacks, where the two compartments of each rucksack share
+    exactly one item and the three rucksacks of a group exactly one badge
+    """
+    rucksacks = []
+    for _ in range(_n(100, scale)):
+        badge = rng.choice(string.ascii_letters)
+        others = [ch for ch in string.ascii_letters if ch != badge]
+        rng.shuffle(others)
+        # disjoint item pools per rucksack, so only the badge is shared by all three
+        for pool in (others[0:17], others[17:34], others[34:51]):
+            common, left, right = pool[0], pool[1:9], pool[9:17]
+            n = rng.randint(4, 15)
+            first = [common, badge] + rng.choices(left, k=n)
+            second = [common] + rng.choices(right, k=n + 1)
+            rng.shuffle(first)
+            rng.shuffle(second)
+            rucksacks.append("".join(first + second))
+    return "\n".join(rucksacks)
+
+
+def _day04(rng: random.Random, scale: float) -> str:
+    def _range() -> str:
+        start = rng.randint(1, 99)
+        return f"{start}-{rng.randint(start, 99)}"
+
+    return "\n".join(f"{_range()},{_range()}" for _ in range(_n(1000, scale)))
+
+
+def _day05(rng: random.Random, scale: float) -> str:
+    """Nine stacks and moves that never take the last crate off a stack"""
+    max_height = _n(8, scale, minimum=2)
+    heights = [rng.randint(1, max_height) for _ in range(9)]
+    heights[0] = max(heights[0], 2)  # so that at least one move is always possible
+    stacks = [rng.choices(string.ascii_uppercase, k=height) for height in heights]
+
+    drawing = [
+        " ".join(
+            f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks
+        )
+        for level in range(max(heights) - 1, -1, -1)
+    ]
+    drawing.append(" " + "   ".join(str(i) for i in range(1, 10)) + " ")
+
+    moves = []
+    for _ in range(_n(500, scale)):
+        src = rng.choice([i for i, height in enumerate(heights) if height > 1])
+        dest = rng.choice([i for i in range(9) if i != src])
+        n = rng.randint(1, heights[src] - 1)
+        heights[src] -= n
+        heights[dest] += n
+        moves.append(f"move {n} from {src + 1} to {dest + 1}")
+
+    return "\n".join(drawing) + "\n\n" + "\n".join(moves)
+
+
+def _day06(rng: random.Random, scale: float) -> str:
+    """
+    A stream of only three different characters, followed by the markers. Both
+    parts have to scan (almost) the whole stream
+    """
+    stream = rng.choices("abc", k=_n(4096, scale))
+    return "".join(stream) + "defghijklmnopqd"
+
+
+def _day07(rng: random.Random, scale: float) -> str:
+    """
+    Terminal transcript of a directory tree which gets deeper with the scale. File
+    sizes are scaled to a total between 45M and 65M at any scale: above the 40M
+    which make a deletion necessary in part 2, and below the 70M of the disk
+    """
+    parents = [-1]
+    for i in range(1, _n(180, scale)):
+        # mostly attach new directories to recently created ones to grow deep trees
+        parents.append(max(0, i - 1 - int(rng.expovariate(0.5))))
+
+    children = [[] for _ in parents]
+    for node, parent in enumerate(parents[1:], start=1):
+        children[parent].append(node)
+
+    def _name() -> str:
+        return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 6)))
+
+    # directory names get their node number appended to be unique among siblings
+    names = [f"{_name()}{node}" for node in range(len(parents))]
+
+    files = [
+        [rng.randint(1000, 300000) for _ in range(rng.randint(0, 4))] for _ in parents
+    ]
+    files[0].append(1000)  # at least one file
+    factor = rng.uniform(45_000_000, 65_000_000) / sum(map(sum, files))
+
+    def _listing(node: int) -> list[str]:
+        lines = ["$ ls"] + [f"dir {names[child]}" for child in children[node]]
+        for size in files[node]:
+            size = max(1, round(size * factor))
+            lines.append(f"{size} {_name()}.{rng.choice('abc')}")
+        return lines
+
+    # iterative depth first traversal, the trees can be much deeper than the
+    # recursion limit
+    lines = ["$ cd /"] + _listing(0)
+    stack = [iter(children[0])]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            if stack:
+                lines.append("$ cd ..")
+            continue
+        lines.append(f"$ cd {names[child]}")
+        lines.extend(_listing(child))
+        stack.append(iter(children[child]))
+
+    return "\n".join(lines)
+
+
+def _day08(rng: random.Random, scale: float) -> str:
+    size = _n(99 * math.sqrt(scale), 1, minimum=3)
+    return "\n".join("".join(rng.choices(string.digits, k=size)) for _ in range(size))
+
+
+def _day09(rng: random.Random, scale: float) -> str:
+    return "\n".join(
+        f"{rng.choice('UDLR')} {rng.randint(1, 19)}" for _ in range(_n(2000, scale))
+    )
+
+
+def _day10(rng: random.Random, scale: float) -> str:
+    """
+    Programs running at least 240 cycles. The screen of part 2 shows noise though,
+    which can't be read as letters
+    """
+    lines, cycles = [], 0
+    while cycles < _n(240, scale, minimum=241):
+        if rng.random() < 0.3:
+            lines.append("noop")
+            cycles += 1
+        else:
+            lines.append(f"addx {rng.randint(-10, 10) or 1}")
+            cycles += 2
+    return "\n".join(lines)
+
+
+_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23]
+
+
+def _day11(rng: random.Random, scale: float) -> str:
+    """
+    Monkeys with prime divisibility tests. With more than ~13 monkeys the product of
+    all tests no longer fits into an int64 and part 2 overflows
+    """
+    n_monkeys = _n(8, scale, minimum=3)
+    monkeys = []
+    for monkey_id in range(n_monkeys):
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        operation = rng.choice(
+            ["* old", f"* {rng.randint(2, 19)}", f"+ {rng.randint(1, 8)}"]
+        )
+        others = [i for i in range(n_monkeys) if i != monkey_id]
+        next_true, next_false = rng.sample(others, k=2)
+        monkeys.append(
+            f"Monkey {monkey_id}:\n"
+            f"  Starting items: {items}\n"
+            f"  Operation: new = old {operation}\n"
+            f"  Test: divisible by {_PRIMES[monkey_id % len(_PRIMES)]}\n"
+            f"    If true: throw to monkey {next_true}\n"
+            f"    If false: throw to monkey {next_false}"
+        )
+    return "\n\n".join(monkeys)
+
+
+def _day12(rng: random.Random, scale: float) -> str:
+    """
+    A noisy slope from S in the top left to E in the bottom right. Neighbouring
+    heights never differ by more than one, so every square is reachable
+    """
+    rows = _n(41 * math.sqrt(scale), 1, minimum=2)
+    cols = max(_n(170 * math.sqrt(scale), 1), 53 - rows)
+
+    lines = []
+    for y in range(rows):
+        heights = [
+            min(25, (x + y + rng.randint(0, 1)) * 26 // (rows + cols + 1))
+            for x in range(cols)
+        ]
+        lines.append("".join(chr(ord("a") + height) for height in heights))
+
+    lines[0] = "S" + lines[0][1:]
+    lines[-1] = lines[-1][:-1] + "E"
+    return "\n".join(lines)
+
+
+def _packet(rng: random.Random, depth: int = 0) -> list:
+    packet = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            packet.append(_packet(rng, depth + 1))
+        else:
+            packet.append(rng.randint(0, 10))
+    return packet
+
+
+def _day13(rng: random.Random, scale: float) -> str:
+    pairs = [
+        f"{_packet(rng)}\n{_packet(rng)}".replace(" ", "")
+        for _ in range(_n(150, scale))
+    ]
+    return "\n\n".join(pairs)
+
+
+def _day14(rng: random.Random, scale: float) -> str:
+    """Rock paths below the sand source, deeper and wider with growing scale"""
+    max_y = _n(170 * math.sqrt(scale), 1, minimum=10)
+    width = _n(40 * math.sqrt(scale), 1, minimum=5)
+
+    paths = []
+    for _ in range(_n(150, scale)):
+        x, y = rng.randint(500 - width, 500 + width), rng.randint(5, max_y)
+        points = [(x, y)]
+        for segment in range(rng.randint(1, 5)):
+            if segment % 2:
+                y = min(max_y, max(5, y + rng.randint(-10, 10)))
+            else:
+                x += rng.randint(-10, 10)
+            points.append((x, y))
+        paths.append(" -> ".join(f"{x},{y}" for x, y in points))
+    return "\n".join(paths)
+
+
+def _day15(rng: random.Random, scale: float) -> str:
+    """
+    Sensors and their beacons. There is no guarantee for a single uncovered spot,
+    so only part 1 is meaningful on these inputs
+    """
+    lines = []
+    for _ in range(_n(30, scale)):
+        x, y = rng.randint(0, 4000000), rng.randint(0, 4000000)
+        beacon_x = x + rng.randint(-1000000, 1000000)
+        beacon_y = y + rng.randint(-1000000, 1000000)
+        lines.append(
+            f"Sensor at x={x}, y={y}: closest beacon is at x={beacon_x}, y={beacon_y}"
+        )
+    return "\n".join(lines)
+
+
+def _day16(rng: random.Random, scale: float) -> str:
+    """
+    A connected cave system. The number of valves with a flow rate stays capped at
+    15, since the search is exponential in it
+    """
+    n_valves = _n(60, scale, minimum=2)
+    length = 2 if n_valves <= 500 else 3
+    names = ["AA"]
+    taken = {"AA"}
+    while len(names) < n_valves:
+        name = "".join(rng.choices(string.ascii_uppercase, k=length))
+        if name not in taken:
+            taken.add(name)
+            names.append(name)
+
+    flow_rates = [0] * n_valves
+    for i in rng.sample(range(1, n_valves), k=min(15, n_valves // 4 or 1)):
+        flow_rates[i] = rng.randint(1, 25)
+
+    tunnels = [set() for _ in names]
+    for i in range(1, n_valves):  # random spanning tree + a few shortcuts
+        for j in {rng.randrange(i), rng.randrange(n_valves)} - {i}:
+            tunnels[i].add(j)
+            tunnels[j].add(i)
+
+    lines = []
+    for name, flow_rate, targets in zip(names, flow_rates, tunnels):
+        targets = ", ".join(names[j] for j in sorted(targets))
+        tunnel = "tunnels lead to valves" if "," in targets else "tunnel leads to valve"
+        lines.append(f"Valve {name} has flow rate={flow_rate}; {tunnel} {targets}")
+    return "\n".join(lines)
+
+
+def _day17(rng: random.Random, scale: float) -> str:
+    """
+    Jet patterns. For much longer patterns than the real ones the tower height
+    repeats less often than part 2 looks for
+    """
+    return "".join(rng.choices("<>", k=_n(10091, scale)))
+
+
+def _day18(rng: random.Random, scale: float) -> str:
+    side = _n(20 * scale ** (1 / 3), 1, minimum=2)
+    n_cubes = min(_n(2800, scale), side**3)
+    cubes = rng.sample(range(side**3), k=n_cubes)
+    return "\n".join(f"{c // side**2},{c // side % side},{c % side}" for c in cubes)
+
+
+def _day19(rng: random.Random, scale: float) -> str:
+    return "\n".join(
+        f"Blueprint {i}: "
+        f"Each ore robot costs {rng.randint(2, 4)} ore. "
+        f"Each clay robot costs {rng.randint(2, 4)} ore. "
+        f"Each obsidian robot costs {rng.randint(2, 4)} ore "
+        f"and {rng.randint(5, 20)} clay. "
+        f"Each geode robot costs {rng.randint(2, 4)} ore "
+        f"and {rng.randint(5, 20)} obsidian."
+        for i in range(1, _n(30, scale) + 1)
+    )
+
+
+def _day20(rng: random.Random, scale: float) -> str:
+    """Numbers to mix, exactly one of them is zero"""
+    values = [
+        rng.choice([-1, 1]) * rng.randint(1, 10000) for _ in range(_n(5000, scale))
+    ]
+    values[rng.randrange(len(values))] = 0
+    return "\n".join(map(str, values))
+
+
+def _day21(rng: random.Random, scale: float) -> str:
+    """
+    A random expression tree with exact integer results for part 1. Part 2 is solved
+    with integer divisions, which only hold for the real inputs
+    """
+    n_operations = _n(1000, scale)
+    length = 4 if n_operations < 50000 else 6
+
+    names, taken = [], {"root", "humn"}
+    while len(names) < 2 * n_operations:
+        name = "".join(rng.choices(string.ascii_lowercase, k=length))
+        if name not in taken:
+            taken.add(name)
+            names.append(name)
+    names = iter(names)
+
+    equations = {}
+    # (name, value, number of operations in its subtree)
+    todo = [("root", rng.randint(10**6, 10**9), n_operations)]
+    while todo:
+        name, value, n = todo.pop()
+        if n == 0:
+            equations[name] = str(value)
+            continue
+
+        op = rng.choice("+-*/" if value < 2**40 else "+-*")
+        if op == "+":
+            left = rng.randint(0, value)
+            right = value - left
+        elif op == "-":
+            right = rng.randint(0, 1000)
+            left = value + right
+        elif op == "*":
+            right = rng.choice([d for d in range(1, 13) if value % d == 0])
+            left = value // right
+        else:
+            right = rng.randint(1, 12)
+            left = value * right
+
+        left_name, right_name = next(names), next(names)
+        equations[name] = (left_name, op, right_name)
+        n_left = rng.randint(0, n - 1)
+        todo.append((left_name, left, n_left))
+        todo.append((right_name, right, n - 1 - n_left))
+
+    leaf = rng.choice(
+        [name for name, expr in equations.items() if isinstance(expr, str)]
+    )
+    renamed = {leaf: "humn"}
+
+    lines = [
+        f"{renamed.get(name, name)}: {expr}"
+        if isinstance(expr, str)
+        else f"{name}: {renamed.get(expr[0], expr[0])} {expr[1]} "
+        f"{renamed.get(expr[2], expr[2])}"
+        for name, expr in equations.items()
+    ]
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+def _day22(rng: random.Random, scale: float) -> str:
+    """
+    The cube net layout the solution hardcodes (50x50 faces), only the walls and
+    the path are random
+    """
+
+    def _row(width: int) -> str:
+        return "".join("#" if rng.random() < 0.1 else "." for _ in range(width))
+
+    rows = (
+        [" " * 50 + _row(100) for _ in range(50)]
+        + [" " * 50 + _row(50) for _ in range(50)]
+        + [_row(100) for _ in range(50)]
+        + [_row(50) for _ in range(50)]
+    )
+    rows[0] = " " * 50 + "." + rows[0][51:]  # the start position is always open
+
+    path = "".join(
+        f"{rng.randint(1, 50)}{rng.choice('LR')}" for _ in range(_n(2000, scale) - 1)
+    )
+    return "\n".join(rows) + "\n\n" + path + str(rng.randint(1, 50))
+
+
+def _day23(rng: random.Random, scale: float) -> str:
+    size = _n(72 * math.sqrt(scale), 1)
+    return "\n".join(
+        "".join("#" if rng.random() < 0.5 else "." for _ in range(size))
+        for _ in range(size)
+    )
+
+
+def _day24(rng: random.Random, scale: float) -> str:
+    """
+    A valley with blizzards. Just like in the real inputs no vertical blizzards are
+    in the columns of the entrance and the exit
+    """
+    height = _n(25 * math.sqrt(scale), 1, minimum=2)
+    width = _n(120 * math.sqrt(scale), 1, minimum=2)
+
+    def _cell(x: int) -> str:
+        if rng.random() < 0.5:
+            return "."
+        return rng.choice("<>" if x in (0, width - 1) else "<>^v")
+
+    rows = ["#." + "#" * width]
+    rows += ["#" + "".join(_cell(x) for x in range(width)) + "#" for _ in range(height)]
+    rows += ["#" * width + ".#"]
+    return "\n".join(rows)
+
+
+def _day25(rng: random.Random, scale: float) -> str:
+    return "\n".join(
+        rng.choice("12") + "".join(rng.choices("=-012", k=rng.randint(0, 19)))
+        for _ in range(_n(120, scale))
+    )
+
+
+GENERATORS: dict[int, Callable[[random.Random, float], str]] = {
+    1: _day01,
+    2: _day02,
+    3: _day03,
+    4: _day04,
+    5: _day05,
+    6: _day06,
+    7: _day07,
+    8: _day08,
+    9: _day09,
+    10: _day10,
+    11: _day11,
+    12: _day12,
+    13: _day13,
+    14: _day14,
+    15: _day15,
+    16: _day16,
+    17: _day17,
+    18: _day18,
+    19: _day19,
+    20: _day20,
+    21: _day21,
+    22: _day22,
+    23: _day23,
+    24: _day24,
+    25: _day25,
+}
+
+
+def generate(day: int, scale: float = 1, seed: int = 0) -> str:
+    """Generate an input for the given day, scale 1 is about as large as the real one"""
+    return GENERATORS[day](random.Random(seed), scale)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.generators",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("days", nargs="*", type=int, help="days (default all)")
+    parser.add_argument("--scale", type=float, default=1, help="size of the inputs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--name", help="input name to register (default: x<scale>)")
+    args = parser.parse_args(argv)
+
+    name = args.name or f"x{args.scale:g}"
+    for day in args.days or sorted(GENERATORS):
+        path = register_input(day, generate(day, args.scale, args.seed), name)
+        print(f"day {day:2}: {path}")
+
+
+@pytest.mark.parametrize("day", range(1, 26))
+def test_generate_deterministic(day: int):
+    assert generate(day, 0.1, seed=1) == generate(day, 0.1, seed=1)
+    assert generate(day, 0.1, seed=1) != generate(day, 0.1, seed=2)
+
+
+@pytest.mark.parametrize("day", range(1, 26))
+def test_generated_inputs_parse(day: int):
+    parse_function(load_day(day))(generate(day, 0.1))
+
+
+@pytest.mark.parametrize("day", [1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 13, 18, 20, 25])
+def test_generated_inputs_solve(day: int):
+    module = load_day(day)
+    for part in parts(module):
+        parsed = parse_function(module)(generate(day, 0.2))
+        call_part(module, day, part, parsed)
+
+
+if __name__ == "__main__":
+    main()
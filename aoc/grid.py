@@ -0,0 +1,138 @@
+"""
+Array backed 2d grids
+
+Positions are (y, x) tuples with y pointing down, the same as numpy indices. An
+OccupancyGrid stores its cells in a numpy array covering a window of the plane: the
+array index of a position is its offset to the window's origin, and the window grows
+automatically whenever a cell outside of it is set. Compared to a set of complex
+numbers this needs a single byte per cell and no hashing for lookups, and whole
+rounds of neighbour checks can be done at once with shift.
+"""
+import numpy as np
+
+UP, RIGHT, DOWN, LEFT = (-1, 0), (0, 1), (1, 0), (0, -1)
+NEIGHBOURS_4 = (UP, RIGHT, DOWN, LEFT)
+NEIGHBOURS_8 = tuple(
+    (dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if (dy, dx) != (0, 0)
+)
+
+
+def shift(cells: np.ndarray, dy: int, dx: int, fill=0) -> np.ndarray:
+    """
+    Move the contents of an array by (dy, dx): result[y + dy, x + dx] = cells[y, x]
+
+    Cells moved out of the array are dropped, the ones moved in are set to fill.
+    """
+    result = np.full_like(cells, fill)
+    height, width = cells.shape
+    if abs(dy) >= height or abs(dx) >= width:
+        return result
+    result[max(dy, 0) : height + min(dy, 0), max(dx, 0) : width + min(dx, 0)] = cells[
+        max(-dy, 0) : height + min(-dy, 0), max(-dx, 0) : width + min(-dx, 0)
+    ]
+    return result
+
+
+class OccupancyGrid:
+    def __init__(self, cells: np.ndarray, origin: tuple[int, int] = (0, 0)):
+        self.cells = cells
+        self.origin = origin  # the position of cells[0, 0]
+
+    @classmethod
+    def empty(cls, shape: tuple[int, int], origin=(0, 0), dtype=bool):
+        return cls(np.zeros(shape, dtype=dtype), origin)
+
+    @classmethod
+    def from_lines(cls, lines: list[str], symbol: str = "#") -> "OccupancyGrid":
+        """Occupy all cells of a character map which are equal to the given symbol"""
+        width = max(map(len, lines))
+        chars = np.array([list(line.ljust(width)) for line in lines])
+        return cls(chars == symbol)
+
+    def copy(self) -> "OccupancyGrid":
+        return OccupancyGrid(self.cells.copy(), self.origin)
+
+    def index(self, y: int, x: int) -> tuple[int, int]:
+        """Array index of a position, which may be outside of the array"""
+        return y - self.origin[0], x - self.origin[1]
+
+    def _inside(self, iy: int, ix: int) -> bool:
+        height, width = self.cells.shape
+        return 0 <= iy < height and 0 <= ix < width
+
+    def __getitem__(self, pos: tuple[int, int]):
+        iy, ix = self.index(*pos)
+        if not self._inside(iy, ix):
+            return self.cells.dtype.type(0)
+        return self.cells[iy, ix]
+
+    def __setitem__(self, pos: tuple[int, int], value):
+        self.grow_to_include(*pos)
+        self.cells[self.index(*pos)] = value
+
+    def __contains__(self, pos: tuple[int, int]) -> bool:
+        return bool(self[pos])
+
+    def grow_to_include(self, y: int, x: int, margin: int = 0):
+        """Grow the window so that it includes all cells within margin of (y, x)"""
+        iy, ix = self.index(y, x)
+        height, width = self.cells.shape
+        before_y, before_x = max(margin - iy, 0), max(margin - ix, 0)
+        after_y = max(iy + margin + 1 - height, 0)
+        after_x = max(ix + margin + 1 - width, 0)
+        if before_y or before_x or after_y or after_x:
+            self.cells = np.pad(self.cells, ((before_y, after_y), (before_x, after_x)))
+            self.origin = (self.origin[0] - before_y, self.origin[1] - before_x)
+
+    def ensure_margin(self, margin: int = 1):
+        """Grow the window so that no occupied cell is closer than margin to its edge"""
+        y0, y1, x0, x1 = self.bounds()
+        self.grow_to_include(y0, x0, margin)
+        self.grow_to_include(y1, x1, margin)
+
+    def occupied(self) -> tuple[np.ndarray, np.ndarray]:
+        """Positions of all occupied cells, as arrays of y and x coordinates"""
+        iy, ix = np.nonzero(self.cells)
+        return iy + self.origin[0], ix + self.origin[1]
+
+    def bounds(self) -> tuple[int, int, int, int]:
+        """Smallest and largest y and x coordinates of the occupied cells"""
+        ys, xs = self.occupied()
+        return int(ys.min()), int(ys.max()), int(xs.min()), int(xs.max())
+
+    def count(self) -> int:
+        return int(np.count_nonzero(self.cells))
+
+    def render(self, chars: str = ".#") -> str:
+        """Draw the window, one character per cell value"""
+        return "\n".join("".join(chars[int(v)] for v in row) for row in self.cells)
+
+
+def test_shift():
+    cells = np.arange(9).reshape(3, 3)
+    assert shift(cells, 1, 0).tolist() == [[0, 0, 0], [0, 1, 2], [3, 4, 5]]
+    assert shift(cells, 0, -1, fill=-1).tolist() == [[1, 2, -1], [4, 5, -1], [7, 8, -1]]
+    assert shift(cells, -1, 1).tolist() == [[0, 3, 4], [0, 6, 7], [0, 0, 0]]
+    assert shift(cells, 3, 0).tolist() == np.zeros((3, 3)).tolist()
+
+
+def test_occupancy_grid():
+    grid = OccupancyGrid.empty((1, 1))
+    grid[-2, 3] = True
+    grid[1, -1] = True
+    assert grid.cells.shape == (4, 5)
+    assert grid.origin == (-2, -1)
+    assert (-2, 3) in grid and (1, -1) in grid
+    assert (0, 0) not in grid and (100, 100) not in grid
+    assert grid.count() == 2
+    assert grid.bounds() == (-2, 1, -1, 3)
+
+    grid.ensure_margin(2)
+    assert grid.bounds() == (-2, 1, -1, 3)
+    assert grid.cells.shape == (8, 9)
+
+
+def test_from_lines():
+    grid = OccupancyGrid.from_lines([".#.", "#"])
+    assert grid.cells.tolist() == [[False, True, False], [True, False, False]]
+    assert grid.render() == ".#.\n#.."
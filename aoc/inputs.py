@@ -0,0 +1,192 @@
+"""
+Local, offline store for puzzle inputs
+
+Inputs live as plain text files below ``inputs/<year>/``:
+
+    inputs/2022/01.txt              the real puzzle input for day 1
+    inputs/2022/synthetic/01.txt    an alternative input registered as "synthetic"
+    inputs/2022/index.json          sha256, size and modification time of every
+                                    input, by name and day
+
+Set the ``AOC_INPUT`` environment variable to a registered name to point all
+``puzzle_input`` fixtures at that alternative input instead of the real one.
+"""
+import hashlib
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+YEAR = 2022
+PUZZLE = "puzzle"  # name of the real puzzle inputs
+
+INPUTS_DIR = Path(__file__).parent.parent / "inputs"
+
+
+def _year_dir() -> Path:
+    return INPUTS_DIR / str(YEAR)
+
+
+def input_path(day: int, name: str = PUZZLE) -> Path:
+    if name == PUZZLE:
+        return _year_dir() / f"{day:02d}.txt"
+    return _year_dir() / name / f"{day:02d}.txt"
+
+
+def _index_path() -> Path:
+    return _year_dir() / "index.json"
+
+
+def read_index() -> dict[str, dict[str, dict]]:
+    """Mapping of input name -> day -> sha256, size and mtime_ns of the stored input"""
+    try:
+        return json.loads(_index_path().read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def _record(day: int, name: str, data: str) -> str:
+    """Record the hash of a stored input in the index, together with its file stats"""
+    stat = input_path(day, name).stat()
+    digest = hashlib.sha256(data.encode()).hexdigest()
+    index = read_index()
+    index.setdefault(name, {})[f"{day:02d}"] = {
+        "sha256": digest,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+    # replaced at once, as several processes may record hashes at the same time
+    tmp_path = _index_path().with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(index, indent=2, sort_keys=True))
+    os.replace(tmp_path, _index_path())
+    return digest
+
+
+def input_hash(day: int, name: str = PUZZLE) -> str:
+    """
+    sha256 of a stored input, taken from the index as long as the size and the
+    modification time of the file match. Inputs which were replaced by hand are
+    hashed again
+    """
+    entry = read_index().get(name, {}).get(f"{day:02d}")
+    path = input_path(day, name)
+    if isinstance(entry, dict) and path.exists():
+        stat = path.stat()
+        if (entry["size"], entry["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+            return entry["sha256"]
+    return _record(day, name, load_input(day, name))
+
+
+def _read(path: Path) -> str:
+    stat = path.stat()
+    return _read_file(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=None)
+def _read_file(path: Path, mtime_ns: int, size: int) -> str:
+    """Contents of a file, cached until it is modified"""
+    return path.read_bytes().decode()
+
+
+def register_input(day: int, data: str, name: str = PUZZLE) -> Path:
+    """Store the given input under the given name and record its hash in the index"""
+    path = input_path(day, name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(data)
+    _record(day, name, data)
+    _read_file.cache_clear()
+    return path
+
+
+def _fetch(day: int) -> str:
+    """Download the real puzzle input once and keep it in the local store"""
+    from aocd.models import Puzzle
+
+    data = Puzzle(YEAR, day).input_data
+    register_input(day, data)
+    return data
+
+
+def resolve_name(name: str | None = None) -> str:
+    """The given input name, else the one set in ``AOC_INPUT``, else the real input"""
+    return name or os.environ.get("AOC_INPUT", PUZZLE)
+
+
+def load_input(day: int, name: str | None = None) -> str:
+    """
+    Load the input for the given day from the local store
+
+    If no name is given the ``AOC_INPUT`` environment variable decides which input
+    to use, defaulting to the real puzzle input. Only the real puzzle input is
+    ever downloaded, and only if it is not stored locally yet.
+    """
+    name = resolve_name(name)
+    path = input_path(day, name)
+    try:
+        return _read(path)
+    except FileNotFoundError:
+        if name != PUZZLE:
+            raise
+    return _fetch(day)
+
+
+@pytest.fixture()
+def tmp_inputs(tmp_path, monkeypatch):
+    monkeypatch.setattr(f"{__name__}.INPUTS_DIR", tmp_path)
+    _read_file.cache_clear()
+    yield tmp_path
+    _read_file.cache_clear()
+
+
+def test_register_and_load(tmp_inputs):
+    path = register_input(1, "1000\n2000\n")
+    assert path == tmp_inputs / "2022" / "01.txt"
+    assert load_input(1) == "1000\n2000\n"
+
+
+def test_named_input(tmp_inputs, monkeypatch):
+    register_input(6, "real")
+    register_input(6, "synthetic", name="scaled")
+    assert load_input(6) == "real"
+    assert load_input(6, "scaled") == "synthetic"
+
+    monkeypatch.setenv("AOC_INPUT", "scaled")
+    assert load_input(6) == "synthetic"
+
+
+def test_missing_named_input(tmp_inputs):
+    with pytest.raises(FileNotFoundError):
+        load_input(6, "scaled")
+
+
+def test_input_hash(tmp_inputs):
+    register_input(2, "A Y\n")
+    assert input_hash(2) == hashlib.sha256(b"A Y\n").hexdigest()
+    assert read_index()[PUZZLE]["02"]["sha256"] == input_hash(2)
+    assert read_index()[PUZZLE]["02"]["size"] == 4
+
+
+def test_replaced_input(tmp_inputs):
+    register_input(2, "A Y\n")
+    assert load_input(2) == "A Y\n"
+    path = input_path(2)
+    path.write_text("B X\nC Z\n")  # dropped in by hand, the index is outdated
+    os.utime(path, ns=(0, 0))  # even if the modification time is not newer
+    assert load_input(2) == "B X\nC Z\n"
+    assert input_hash(2) == hashlib.sha256(b"B X\nC Z\n").hexdigest()
+    assert read_index()[PUZZLE]["02"]["sha256"] == input_hash(2)  # recorded again
+    assert not list(tmp_inputs.rglob("*.tmp"))
+
+
+def test_input_hash_from_index(tmp_inputs, monkeypatch):
+    register_input(2, "A Y\n")
+    # the file didn't change since it was registered, so it isn't read again
+    monkeypatch.setattr(f"{__name__}.load_input", None)
+    assert input_hash(2) == hashlib.sha256(b"A Y\n").hexdigest()
+
+
+def test_empty_input(tmp_inputs):
+    register_input(3, "")
+    assert load_input(3) == ""
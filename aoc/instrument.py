@@ -0,0 +1,153 @@
+"""
+Record wall time, cpu time and peak memory of parse, part1 and part2 per day
+
+    python -m aoc.instrument                      # all days, json lines to stdout
+    python -m aoc.instrument 4 17 19 -o mem.jsonl
+
+Peak memory is measured with tracemalloc, so it covers all allocations made from
+python (including numpy arrays) but none made inside numba compiled code. Tracing
+slows down allocation heavy code, pass --no-memory for accurate timings.
+"""
+import argparse
+import functools
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from aoc.inputs import load_input, register_input
+from aoc.runner import available_days, call_part, load_day, parse_function, parts
+
+
+@dataclass
+class Measurement:
+    day: int
+    phase: str
+    wall_time: float  # seconds
+    cpu_time: float  # seconds
+    peak_memory: int | None  # bytes allocated on top of what was allocated before
+
+
+def measure(
+    func: Callable[..., Any], *args, trace_memory: bool = True
+) -> tuple[Any, float, float, int | None]:
+    """Call func(*args), returning its result, wall time, cpu time and peak memory"""
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if trace_memory:
+        tracemalloc.reset_peak()
+        allocated_before, _ = tracemalloc.get_traced_memory()
+
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    result = func(*args)
+    wall_time = time.perf_counter() - wall_start
+    cpu_time = time.process_time() - cpu_start
+
+    peak_memory = None
+    if trace_memory:
+        peak_memory = tracemalloc.get_traced_memory()[1] - allocated_before
+    if started_tracing:
+        tracemalloc.stop()
+
+    return result, wall_time, cpu_time, peak_memory
+
+
+def instrumented(
+    func: Callable[..., Any],
+    day: int,
+    phase: str,
+    measurements: list[Measurement],
+    trace_memory: bool = True,
+) -> Callable[..., Any]:
+    """Wrap func so that every call appends a measurement to the given list"""
+
+    @functools.wraps(func)
+    def _wrapper(*args):
+        result, *stats = measure(func, *args, trace_memory=trace_memory)
+        measurements.append(Measurement(day, phase, *stats))
+        return result
+
+    return _wrapper
+
+
+def instrument_day(
+    day: int, input_name: str | None = None, trace_memory: bool = True
+) -> list[Measurement]:
+    module = load_day(day)
+    data = load_input(day, input_name)
+
+    measurements = []
+    parse = parse_function(module)
+    parsed = instrumented(parse, day, "parse", measurements, trace_memory)(data)
+    for part in parts(module):
+        solve = instrumented(
+            lambda parsed, part=part: call_part(module, day, part, parsed),
+            day,
+            part,
+            measurements,
+            trace_memory,
+        )
+        solve(parsed)
+
+    return measurements
+
+
+def write_json_lines(measurements: Iterable[Measurement], file) -> None:
+    for measurement in measurements:
+        file.write(json.dumps(asdict(measurement)) + "\n")
+    file.flush()
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.instrument",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default all)")
+    parser.add_argument("-i", "--input", help="name of the inputs to use")
+    parser.add_argument("-o", "--output", type=Path, help="write json lines here")
+    parser.add_argument(
+        "--no-memory", action="store_true", help="don't trace memory allocations"
+    )
+    args = parser.parse_args(argv)
+
+    file = args.output.open("w") if args.output else sys.stdout
+    try:
+        for day in args.days or available_days():
+            write_json_lines(instrument_day(day, args.input, not args.no_memory), file)
+    finally:
+        if args.output:
+            file.close()
+
+
+def test_measure():
+    result, wall_time, cpu_time, peak_memory = measure(lambda n: [0] * n, 100000)
+    assert result == [0] * 100000
+    assert wall_time >= 0 and cpu_time >= 0
+    assert peak_memory >= 100000 * 8  # a pointer per list element
+    assert not tracemalloc.is_tracing()
+
+
+def test_instrumented():
+    measurements = []
+    double = instrumented(lambda x: 2 * x, 1, "part1", measurements)
+    assert double(21) == 42
+    (measurement,) = measurements
+    assert (measurement.day, measurement.phase) == (1, "part1")
+
+
+def test_instrument_day(tmp_path, monkeypatch):
+    monkeypatch.setattr("aoc.inputs.INPUTS_DIR", tmp_path)
+    register_input(6, "bvwbjplbgvbhsrlpgdmjqwftvncz", name="example")
+    measurements = instrument_day(6, "example")
+    assert [m.phase for m in measurements] == ["parse", "part1", "part2"]
+    assert all(m.peak_memory is not None for m in measurements)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Lazily compiled numba kernels
+
+Importing numba alone takes about a third of a second, and kernels with explicit
+signatures are compiled right when the module defining them is imported. Kernels
+decorated with ``aoc.jit.njit`` instead only import numba and compile on their
+first call, so importing a day module stays cheap.
+
+Compiled kernels are cached on disk by numba (in __pycache__, or NUMBA_CACHE_DIR if
+set), keyed on their source file and signature. Warm the cache ahead of time with:
+
+    python -m aoc.jit
+"""
+import functools
+import importlib
+import time
+import types
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+# every kernel defined so far, in the order of their definition
+KERNELS: list["LazyKernel"] = []
+
+
+class LazyKernel:
+    """A python function which is compiled with numba.njit on its first call"""
+
+    def __init__(self, func: Callable, signature: str | None = None, **options):
+        functools.update_wrapper(self, func)
+        self.py_func = func
+        self.signature = signature
+        self.options = {"cache": True, **options}
+        self._dispatcher = None
+
+        # seconds spent compiling (or loading from the cache) and executing
+        self.compile_time = 0.0
+        self.execute_time = 0.0
+        KERNELS.append(self)
+
+    @property
+    def name(self) -> str:
+        return f"{self.py_func.__module__}.{self.py_func.__qualname__}"
+
+    @property
+    def compiled(self) -> bool:
+        return self._dispatcher is not None
+
+    @property
+    def dispatcher(self):
+        """The numba dispatcher, compiling the kernel if that didn't happen yet"""
+        if self._dispatcher is None:
+            import numba
+
+            func = self.py_func
+            # numba can only call other kernels if they are compiled as well, so give
+            # the kernel a copy of its globals with the compiled versions of those
+            lazy_globals = {
+                name: value.dispatcher
+                for name, value in func.__globals__.items()
+                if isinstance(value, LazyKernel) and name in func.__code__.co_names
+            }
+            if lazy_globals:
+                func = types.FunctionType(
+                    func.__code__,
+                    {**func.__globals__, **lazy_globals},
+                    func.__name__,
+                    func.__defaults__,
+                    func.__closure__,
+                )
+                func.__qualname__ = self.py_func.__qualname__
+
+            start = time.perf_counter()
+            signature = () if self.signature is None else (self.signature,)
+            self._dispatcher = numba.njit(*signature, **self.options)(func)
+            self.compile_time += time.perf_counter() - start
+        return self._dispatcher
+
+    def __call__(self, *args, **kwargs) -> Any:
+        dispatcher = self.dispatcher
+        n_overloads = len(dispatcher.overloads)
+
+        start = time.perf_counter()
+        try:
+            return dispatcher(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            if len(dispatcher.overloads) > n_overloads:  # compiled for new types
+                self.compile_time += duration
+            else:
+                self.execute_time += duration
+
+    @property
+    def cache_hits(self) -> int:
+        if self._dispatcher is None:
+            return 0
+        return sum(self._dispatcher.stats.cache_hits.values())
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name:<32} compile {self.compile_time:8.3f}s  "
+            f"execute {self.execute_time:8.3f}s  cache hits {self.cache_hits}"
+        )
+
+
+def njit(signature: str | Callable | None = None, **options):
+    """
+    Drop-in replacement for numba.njit which defers importing numba and compiling
+    until the first call, and caches on disk by default. Signatures have to be
+    given as strings, e.g.:
+
+    @njit("int64(complex128[:])")
+    def kernel(values): ...
+    """
+    if callable(signature):  # used as @njit without arguments
+        return LazyKernel(signature, **options)
+    return functools.partial(LazyKernel, signature=signature, **options)
+
+
+def report(module: str | None = None) -> list[str]:
+    """One line per compiled kernel (of the given module), with its timings"""
+    return [
+        str(kernel)
+        for kernel in KERNELS
+        if kernel.compiled and module in (None, kernel.py_func.__module__)
+    ]
+
+
+def precompile() -> list[LazyKernel]:
+    """Compile the kernels of all day modules, filling the on-disk cache"""
+    for path in sorted(Path(__file__).parent.glob("day[0-9][0-9].py")):
+        importlib.import_module(f"aoc.{path.stem}")
+
+    # kernels without a signature can only be compiled for concrete arguments
+    kernels = [kernel for kernel in KERNELS if kernel.signature is not None]
+    for kernel in kernels:
+        kernel.dispatcher
+    return kernels
+
+
+@njit("int64(int64)")
+def _square(x: int) -> int:
+    return x * x
+
+
+@njit
+def _sum_of_squares(values):
+    total = 0
+    for value in values:
+        total += _square(value)
+    return total
+
+
+def test_lazy_kernel():
+    assert not _sum_of_squares.compiled
+    assert _sum_of_squares(np.array([1, 2, 3])) == 14
+    assert _sum_of_squares.compiled
+    assert _square.compiled  # compiled as a dependency of _sum_of_squares
+
+    assert _sum_of_squares.compile_time > 0
+    _sum_of_squares(np.array([4]))
+    assert _sum_of_squares.execute_time > 0
+    assert any(line.startswith("aoc.jit._sum_of_squares") for line in report())
+
+
+def test_kernels_are_cached():
+    assert all(kernel.options["cache"] for kernel in KERNELS)
+
+
+if __name__ == "__main__":
+    # use the kernel registry of aoc.jit, not the one of this __main__ module
+    from aoc import jit
+
+    for kernel in jit.precompile():
+        print(kernel)
@@ -0,0 +1,230 @@
+"""
+Run the solutions of several days in a process pool, outside of pytest
+
+    python -m aoc                 # all days, one worker per cpu
+    python -m aoc 1 2 3 -j 2      # only the given days, with two workers
+    python -m aoc 16 --no-cache   # recompute answers even if they are cached
+"""
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+from aoc import cache, jit
+from aoc.inputs import input_hash, input_path, load_input, register_input, resolve_name
+
+# the days with the longest runtime, slowest first. Submitting those to the pool
+# before all others keeps the total wall time close to the slowest single day
+SLOWEST_DAYS = (16, 19, 24, 17, 20)
+
+# modules which are slow to import and must only be imported when actually needed
+HEAVY_MODULES = ("aocd", "numba", "networkx", "shapely", "advent_of_code_ocr", "tqdm")
+
+# arguments some parts need in addition to the parsed input
+PART_ARGS = {(15, "part1"): (2000000,)}
+
+PARTS = ("part1", "part2")
+
+
+def available_days() -> list[int]:
+    return sorted(
+        int(path.stem[3:]) for path in Path(__file__).parent.glob("day[0-9][0-9].py")
+    )
+
+
+def schedule(days: list[int]) -> list[int]:
+    """Order the given days so that the slowest ones are started first"""
+    slowest = [day for day in SLOWEST_DAYS if day in days]
+    return slowest + sorted(set(days) - set(slowest))
+
+
+def load_day(day: int) -> ModuleType:
+    return importlib.import_module(f"aoc.day{day:02d}")
+
+
+def parse_function(module: ModuleType) -> Callable[[str], Any]:
+    # some days (e.g. day06) work on the raw input string directly
+    return getattr(module, "parse", lambda data: data)
+
+
+def parts(module: ModuleType) -> list[str]:
+    return [part for part in PARTS if hasattr(module, part)]
+
+
+def call_part(module: ModuleType, day: int, part: str, parsed: Any) -> Any:
+    # days with multiple parsed values (e.g. day05) pass them as separate arguments
+    args = parsed if isinstance(parsed, tuple) else (parsed,)
+    return getattr(module, part)(*args, *PART_ARGS.get((day, part), ()))
+
+
+@dataclass
+class DayResult:
+    day: int
+    answers: dict[str, str]
+    timings: dict[str, float]  # wall time in seconds per phase
+    # compile and execution times of the numba kernels used by this day
+    kernels: list[str] = field(default_factory=list)
+    cached: list[str] = field(default_factory=list)  # parts taken from the cache
+
+    def __str__(self) -> str:
+        timings = "  ".join(
+            f"{phase} {seconds:8.3f}s" for phase, seconds in self.timings.items()
+        )
+        answers = ", ".join(self.answers.values())
+        kernels = "".join(f"\n    {kernel}" for kernel in self.kernels)
+        cached = f"  [{', '.join(self.cached)} cached]" if self.cached else ""
+        return f"day {self.day:02d}  {timings}  ({answers}){cached}{kernels}"
+
+
+def _cache_keys(module: ModuleType, day: int, input_name: str | None):
+    input_digest = input_hash(day, resolve_name(input_name))
+    code_digest = cache.code_hash(module)
+    return {
+        part: cache.cache_key(day, part, input_digest, code_digest)
+        for part in parts(module)
+    }
+
+
+def run_day(
+    day: int, input_name: str | None = None, use_cache: bool = True
+) -> DayResult:
+    module = load_day(day)
+    keys = _cache_keys(module, day, input_name) if use_cache else {}
+    answers = {part: cache.get(key) for part, key in keys.items()}
+    cached = [part for part, answer in answers.items() if answer is not None]
+    missing = [part for part in parts(module) if part not in cached]
+
+    timings = {}
+    if missing:  # only parse if at least one answer has to be computed
+        data = load_input(day, input_name)
+        parse = parse_function(module)
+
+        start = time.perf_counter()
+        parsed = parse(data)
+        timings["parse"] = time.perf_counter() - start
+
+    for part in missing:  # parts never modify their input, share one parse
+        start = time.perf_counter()
+        answers[part] = str(call_part(module, day, part, parsed))
+        timings[part] = time.perf_counter() - start
+        if use_cache:
+            cache.put(keys[part], answers[part])
+
+    answers = {part: answers[part] for part in parts(module)}
+    return DayResult(day, answers, timings, jit.report(module.__name__), cached)
+
+
+def run(
+    days: list[int],
+    workers: int | None = None,
+    input_name: str | None = None,
+    use_cache: bool = True,
+) -> list[DayResult]:
+    """Run all given days in a process pool, printing each result when its done"""
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(run_day, day, input_name, use_cache) for day in schedule(days)
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            print(result, flush=True)
+            results.append(result)
+
+    return sorted(results, key=lambda result: result.day)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default all)")
+    parser.add_argument(
+        "-j", "--workers", type=int, default=os.cpu_count(), help="worker processes"
+    )
+    parser.add_argument("-i", "--input", help="name of the inputs to use")
+    parser.add_argument("-o", "--output", type=Path, help="write results as json")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="don't use or store cached answers"
+    )
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    use_cache = cache.enabled() and not args.no_cache
+    results = run(args.days or available_days(), args.workers, args.input, use_cache)
+    print(f"total wall time: {time.perf_counter() - start:.3f}s")
+
+    if args.output:
+        args.output.write_text(json.dumps([asdict(r) for r in results], indent=2))
+
+
+def test_available_days():
+    assert available_days() == list(range(1, 26))
+
+
+def test_schedule():
+    assert schedule([1, 17, 3, 16, 2]) == [16, 17, 1, 2, 3]
+
+
+def test_run_day(tmp_path, monkeypatch):
+    monkeypatch.setattr("aoc.inputs.INPUTS_DIR", tmp_path)
+    register_input(6, "bvwbjplbgvbhsrlpgdmjqwftvncz", name="example")
+
+    result = run_day(6, "example", use_cache=False)
+    assert result.answers == {"part1": "5", "part2": "23"}
+    assert list(result.timings) == ["parse", "part1", "part2"]
+
+
+def test_run_day_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr("aoc.inputs.INPUTS_DIR", tmp_path / "inputs")
+    monkeypatch.setattr("aoc.cache.CACHE_DIR", tmp_path / "cache")
+    register_input(6, "bvwbjplbgvbhsrlpgdmjqwftvncz", name="example")
+
+    assert run_day(6, "example").cached == []
+    result = run_day(6, "example")
+    assert result.answers == {"part1": "5", "part2": "23"}
+    assert result.cached == ["part1", "part2"]
+    assert result.timings == {}  # not even parsed
+
+    register_input(6, "nppdvjthqldpwncqszvftbrmjlhg", name="example")
+    result = run_day(6, "example")
+    assert result.answers == {"part1": "6", "part2": "23"}
+    assert result.cached == []
+
+    # an input replaced by hand, without updating the index
+    input_path(6, "example").write_text("zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw")
+    result = run_day(6, "example")
+    assert result.answers == {"part1": "11", "part2": "26"}
+    assert result.cached == []
+
+
+def test_import_time():
+    """Importing all day modules must be fast and must not import heavy modules"""
+    modules = ", ".join(f"aoc.day{day:02d}" for day in available_days())
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {modules}\n"
+        "print(time.perf_counter() - start)\n"
+        f"print(*[m for m in {HEAVY_MODULES} if m in sys.modules])\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.splitlines()
+
+    assert float(output[0]) < 1.0
+    assert output[1] == ""